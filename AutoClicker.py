@@ -1,6 +1,10 @@
 # ==================================================================================================
 #                                         IMPORTS
 # ==================================================================================================
+import collections
+import contextlib
+import ctypes
+import functools
 import json
 import math
 import os
@@ -124,6 +128,7 @@ TRANSLATIONS = {
         'click_mouse_check': "Random mouse click",
         'scroll_mouse_check': "Random mouse scroll",
         'press_keys_check': "Press keys",
+        'skip_when_active_check': "Skip cycle when I'm active",
         'presets_label': "Presets:",
         'custom_keys_label': "Custom keys:",
         'custom_keys_placeholder': "e.g. efq",
@@ -264,6 +269,7 @@ TRANSLATIONS = {
         'click_mouse_check': "Losowe kliknięcie myszą",
         'scroll_mouse_check': "Losowe przewijanie rolką",
         'press_keys_check': "Wciskaj klawisze",
+        'skip_when_active_check': "Pomiń cykl, gdy jestem aktywny",
         'presets_label': "Predefiniowane:",
         'custom_keys_label': "Własne klawisze:",
         'custom_keys_placeholder': "np. efq",
@@ -320,10 +326,103 @@ TRANSLATIONS = {
 
 
 # --- Global Constants ---
-# Defines the path for the settings file, the copyright text, and the default UI color.
+# Defines the path for the settings file, the copyright text, the default UI color and timing constants.
 SETTINGS_PATH = os.path.join(os.path.expanduser("~"), ".autoclicker_piotrunius.json")
 COPYRIGHT_TEXT = f'Made with love by <a href="https://e-z.bio/piotrunius" style="color: {{ACCENT_COLOR}}; text-decoration:none;">Piotrunius</a> © {time.strftime("%Y")}'
 DEFAULT_ACCENT_COLOR = "#42a5f5"
+WINDOW_CHECK_TTL_S = 0.05 # How long a foreground-window check is reused by the clicker.
+MAX_CLICK_LAG_S = 0.1 # How far the clicker may fall behind schedule before it resyncs.
+SAVE_DEBOUNCE_MS = 250 # Quiet period after the last settings change before it's written to disk.
+THEME_DEBOUNCE_MS = 80 # Quiet period after the last theme/accent change before the stylesheet is rebuilt.
+MULTI_CLICK_GAP_S = 0.05 # Delay between the clicks of a double/triple click.
+FIXED_POS_SETTLE_S = 0.01 # Pause after moving the cursor to the fixed click position.
+AFK_ACTION_GAP_S = 0.1 # Pause between consecutive Anti-AFK actions (and how long keys are held).
+ACTIVATION_MODES = ("hold", "toggle", "burst") # Indexed by the id of the activation mode radio button.
+AFK_ACTIVITY_TOLERANCE_S = 0.5 # Input this close to our own actions (e.g. hotkey release) isn't user activity.
+
+# --- Shared Input Controllers ---
+# Created once and reused by every worker, so starting a worker doesn't open a new display
+# connection (X11) or controller each time. pynput's backends are safe to share between threads.
+SHARED_MOUSE = MouseController()
+SHARED_KEYBOARD = KeyboardController()
+
+# ==================================================================================================
+#                                 NATIVE INPUT HELPERS
+# ==================================================================================================
+
+# --- Win32 SendInput Structures ---
+# pynput sends the press and the release of a click as two separate SendInput calls. On Windows
+# the clicker pre-builds both events once and injects them with a single call instead.
+if sys.platform == "win32":
+    from ctypes import wintypes
+
+    class _MOUSEINPUT(ctypes.Structure):
+        _fields_ = [("dx", wintypes.LONG), ("dy", wintypes.LONG), ("mouseData", wintypes.DWORD),
+                    ("dwFlags", wintypes.DWORD), ("time", wintypes.DWORD), ("dwExtraInfo", ctypes.c_void_p)]
+
+    class _INPUT_UNION(ctypes.Union):
+        _fields_ = [("mi", _MOUSEINPUT)]
+
+    class _INPUT(ctypes.Structure):
+        _fields_ = [("type", wintypes.DWORD), ("union", _INPUT_UNION)]
+
+    # Private DLL handles: ctypes.windll caches one function object per export for the whole process,
+    # so setting argtypes/restype there would also change the prototypes pynput calls with its own structs.
+    _user32 = ctypes.WinDLL("user32")
+    _kernel32 = ctypes.WinDLL("kernel32")
+
+    _INPUT_MOUSE = 0
+    _SendInput = _user32.SendInput
+    _SendInput.argtypes = (wintypes.UINT, ctypes.POINTER(_INPUT), ctypes.c_int)
+    _SendInput.restype = wintypes.UINT
+    # (down, up) MOUSEEVENTF_* flags for each supported button.
+    _MOUSE_BUTTON_FLAGS = {MouseButton.left: (0x0002, 0x0004), MouseButton.right: (0x0008, 0x0010), MouseButton.middle: (0x0020, 0x0040)}
+    _winmm = ctypes.windll.winmm
+
+    class _LASTINPUTINFO(ctypes.Structure):
+        _fields_ = [("cbSize", wintypes.UINT), ("dwTime", wintypes.DWORD)]
+
+    _GetLastInputInfo = _user32.GetLastInputInfo
+    _GetTickCount = _kernel32.GetTickCount
+    _GetTickCount.restype = wintypes.DWORD
+else:
+    _SendInput = None
+    _MOUSE_BUTTON_FLAGS = {}
+    _winmm = None
+    _GetLastInputInfo = None
+
+# --- Native Click Factory ---
+# Returns a callable that performs one full click (down + up) of the given button through a single
+# pre-built SendInput call, or None when native injection isn't available on this platform.
+def make_native_click(button: MouseButton):
+    flags = _MOUSE_BUTTON_FLAGS.get(button)
+    if _SendInput is None or flags is None: return None
+    inputs = (_INPUT * 2)(*(_INPUT(_INPUT_MOUSE, _INPUT_UNION(mi=_MOUSEINPUT(0, 0, 0, flag, 0, None))) for flag in flags))
+    input_size = ctypes.sizeof(_INPUT)
+    def click(): _SendInput(2, inputs, input_size)
+    return click
+
+# --- High Resolution Timer ---
+# Windows rounds timed waits up to the system timer tick (~15.6 ms by default), which caps the
+# clicker well below high CPS settings. This raises the resolution to 1 ms while the block runs.
+# Other platforms already wait with sub-millisecond precision, so it's a no-op there.
+@contextlib.contextmanager
+def high_resolution_timer():
+    if _winmm is None:
+        yield
+        return
+    _winmm.timeBeginPeriod(1)
+    try: yield
+    finally: _winmm.timeEndPeriod(1)
+
+# --- User Idle Time ---
+# Returns the seconds since the last keyboard/mouse input reached the system (synthetic input
+# included), or None when the platform doesn't expose it.
+def get_idle_seconds():
+    if _GetLastInputInfo is None: return None
+    info = _LASTINPUTINFO(ctypes.sizeof(_LASTINPUTINFO), 0)
+    if not _GetLastInputInfo(ctypes.byref(info)): return None
+    return ((_GetTickCount() - info.dwTime) & 0xFFFFFFFF) / 1000.0
 
 # ==================================================================================================
 #                                 SETTINGS HELPER FUNCTIONS
@@ -340,12 +439,49 @@ def load_settings():
     return {}
 
 # --- Save Settings ---
-# Writes the current application settings to the JSON file.
-def save_settings(data: dict):
+# Writes are serialized by a lock; the generation counter lets queued background saves that
+# have been superseded by a newer one skip their (stale) write.
+_SAVE_LOCK = threading.Lock()
+_save_generation = 0
+
+def _write_settings_payload(payload: str):
     try:
-        with open(SETTINGS_PATH, "w", encoding="utf-8") as f: json.dump(data, f, ensure_ascii=False, indent=2)
+        with open(SETTINGS_PATH, "w", encoding="utf-8") as f: f.write(payload)
     except Exception: pass
 
+# Writes the current application settings to the JSON file.
+def save_settings(data: dict):
+    global _save_generation
+    try: payload = json.dumps(data, ensure_ascii=False, indent=2)
+    except Exception: return
+    with _SAVE_LOCK:
+        _save_generation += 1
+        _write_settings_payload(payload)
+
+# --- Background Save Job ---
+# Writes an already serialized settings snapshot on a QThreadPool thread.
+class _SaveSettingsJob(QtCore.QRunnable):
+    def __init__(self, payload: str, generation: int):
+        super().__init__()
+        self.payload = payload
+        self.generation = generation
+
+    def run(self):
+        with _SAVE_LOCK:
+            if self.generation != _save_generation: return
+            _write_settings_payload(self.payload)
+
+# --- Save Settings (Async) ---
+# Snapshots the settings on the calling thread and writes them without blocking it.
+def save_settings_async(data: dict):
+    global _save_generation
+    try: payload = json.dumps(data, ensure_ascii=False, indent=2)
+    except Exception: return
+    with _SAVE_LOCK:
+        _save_generation += 1
+        generation = _save_generation
+    QtCore.QThreadPool.globalInstance().start(_SaveSettingsJob(payload, generation))
+
 # ==================================================================================================
 #                                         DATA CLASSES
 # ==================================================================================================
@@ -387,6 +523,7 @@ class AntiAfkConfig:
     use_human_like_move: bool = False
     human_move_mode_index: int = 0 # 0=bezier1, 1=bezier2, 2=gravity
     human_move_duration: float = 0.3
+    skip_when_user_active: bool = False # Skip a cycle if the user gave input since the last one.
 
 # ==================================================================================================
 #                                         WORKER THREADS
@@ -395,80 +532,140 @@ class AntiAfkConfig:
 # --- ClickWorker Class ---
 # This QThread performs the actual clicking actions in the background to prevent the UI from freezing.
 class ClickWorker(QtCore.QThread):
-    sig_finished = QtCore.pyqtSignal() # Signal emitted when the worker is done.
     def __init__(self, cfg: ClickConfig, main_window, parent=None):
         super().__init__(parent)
         self.cfg = cfg
         self.main_window = main_window
         self._stop_event = threading.Event()
-        self.mouse = MouseController()
+        self.mouse = SHARED_MOUSE
+        self._click_once = make_native_click(cfg.click_button) or functools.partial(self.mouse.click, cfg.click_button, 1)
+        self._title_re = self._compile_title_pattern(cfg.window_title) if (cfg.limit_to_window and cfg.window_title) else None
+        self._window_match = False
+        self._window_check_expiry = 0.0
+        self._do_single_click = self._build_click_routine()
+
+    # Compiles the window title filter once; titles that aren't valid regexes are matched literally.
+    @staticmethod
+    def _compile_title_pattern(title: str):
+        try: return re.compile(title, re.IGNORECASE)
+        except re.error: return re.compile(re.escape(title), re.IGNORECASE)
 
     # Gracefully stops the worker thread.
     def stop(self): self._stop_event.set()
 
     # Main entry point for the thread's execution.
     def run(self):
-        if self.cfg.start_delay_s > 0: self._sleep_interruptible(self.cfg.start_delay_s)
-        if self.cfg.is_burst_mode: self._run_burst_mode()
-        else: self._run_continuous_mode()
-        self.sig_finished.emit()
+        if self.cfg.start_delay_s > 0: self._stop_event.wait(self.cfg.start_delay_s)
+        with high_resolution_timer():
+            if self.cfg.is_burst_mode: self._run_burst_mode()
+            else: self._run_continuous_mode()
 
     # Logic for executing a fixed number of clicks (Burst Mode).
     def _run_burst_mode(self):
         burst_interval_s = self.cfg.burst_delay_ms / 1000.0
+        do_click = self._do_single_click
+        stop_is_set = self._stop_event.is_set
+        wait = self._stop_event.wait
+        perf_counter = time.perf_counter
+        # Same absolute-deadline scheduling as continuous mode, so the burst keeps its rate.
+        next_deadline = perf_counter()
         for _ in range(self.cfg.burst_clicks):
-            if self._stop_event.is_set(): break
-            self._do_single_click()
-            self._sleep_interruptible(burst_interval_s)
+            if stop_is_set(): break # Checked every click: a multi-click can outlast the burst delay.
+            do_click()
+            next_deadline += burst_interval_s
+            now = perf_counter()
+            sleep_for = next_deadline - now
+            if sleep_for > 0:
+                if wait(sleep_for): break
+            elif sleep_for < -MAX_CLICK_LAG_S:
+                next_deadline = now # Fell far behind: resync instead of catching up in a burst.
 
     # Logic for continuous clicking until stopped (Hold/Toggle Mode).
     def _run_continuous_mode(self):
+        # Config is constant for the worker's lifetime, so resolve it once outside the loop.
+        base_interval = 1.0 / max(0.1, self.cfg.cps)
+        use_jitter = self.cfg.use_random_variation
+        jitter_s = self.cfg.jitter_ms / 1000.0
+        click_limit = self.cfg.click_limit
+        do_click = self._do_single_click
+        stop_is_set = self._stop_event.is_set
+        wait = self._stop_event.wait
+        rand = random.random # C-level, unlike random.uniform which wraps it in a Python frame.
+        jitter_span = 2.0 * jitter_s
+        perf_counter = time.perf_counter
+
+        # Clicks are scheduled against absolute deadlines so the time spent clicking doesn't
+        # stretch the interval and the requested CPS holds on average.
         click_count = 0
-        while not self._stop_event.is_set():
-            self._do_single_click()
+        next_deadline = perf_counter()
+        while not stop_is_set():
+            do_click()
             click_count += 1
-            if self.cfg.click_limit > 0 and click_count >= self.cfg.click_limit: break
-            base_interval = 1.0 / max(0.1, self.cfg.cps)
-            interval = base_interval
-            if self.cfg.use_random_variation:
-                jitter = self.cfg.jitter_ms / 1000.0
-                delta = random.uniform(-jitter, jitter)
-                interval = max(0.001, base_interval + delta)
-            self._sleep_interruptible(interval)
-
-    # Performs a single, validated mouse click.
-    def _do_single_click(self):
-        # Check if clicking should be restricted to a specific window.
-        if self.cfg.limit_to_window and self.cfg.window_title:
+            if click_limit > 0 and click_count >= click_limit: break
+            interval = max(0.001, base_interval + rand() * jitter_span - jitter_s) if use_jitter else base_interval
+            next_deadline += interval
+            now = perf_counter()
+            sleep_for = next_deadline - now
+            if sleep_for > 0:
+                if wait(sleep_for): break
+            elif sleep_for < -MAX_CLICK_LAG_S:
+                next_deadline = now # Fell far behind (e.g. system pause): resync instead of catching up in a burst.
+
+    # Composes the single-click routine from only the steps enabled in the config. The config
+    # can't change while the worker runs, so the per-click path never re-checks these settings.
+    def _build_click_routine(self):
+        cfg = self.cfg
+        click_once = self._click_once
+        register_programmatic = self.main_window.register_programmatic_click
+        wait = self._stop_event.wait
+
+        # Click (single, double or triple) with a short delay between multi-clicks.
+        extra_clicks = range(cfg.click_type - 1)
+        def click():
+            register_programmatic()
+            click_once()
+            for _ in extra_clicks:
+                if wait(MULTI_CLICK_GAP_S): return
+                register_programmatic()
+                click_once()
+        routine = click
+
+        # Move the mouse to the fixed position first (no move or settle pause if it's already there).
+        if cfg.use_fixed_position:
+            mouse = self.mouse
+            fixed_pos = (cfg.fixed_x, cfg.fixed_y)
+            def click_at_fixed_position():
+                if mouse.position != fixed_pos:
+                    mouse.position = fixed_pos
+                    if wait(FIXED_POS_SETTLE_S): return
+                click()
+            routine = click_at_fixed_position
+
+        # Only click while the target window is in the foreground.
+        if self._title_re is not None:
+            window_matches = self._window_matches
+            unchecked_routine = routine
+            def click_in_window():
+                if window_matches(): unchecked_routine()
+            routine = click_in_window
+
+        return routine
+
+    # Checks whether the target window is in the foreground. The foreground window can't change
+    # meaningfully within 50 ms, so the last result is reused for that long.
+    def _window_matches(self):
+        now = time.perf_counter()
+        if now >= self._window_check_expiry:
             try:
                 active_window = pygetwindow.getActiveWindow()
-                if active_window is None or not re.search(self.cfg.window_title, active_window.title, re.IGNORECASE): return
-            except Exception: return
-        # Move mouse to a fixed position if enabled.
-        if self.cfg.use_fixed_position:
-            self.mouse.position = (self.cfg.fixed_x, self.cfg.fixed_y)
-            self._sleep_interruptible(0.01)
-        # Perform the click.
-        self.main_window.programmatic_click = True
-
-        # Check for click type (single, double, triple)
-        for i in range(self.cfg.click_type):
-            self.mouse.click(self.cfg.click_button, 1)
-            if i < self.cfg.click_type - 1:
-                self._sleep_interruptible(0.05) # Short delay between multi-clicks
-
-
-    # A sleep implementation that can be interrupted by the stop event.
-    def _sleep_interruptible(self, seconds: float):
-        end_time = time.perf_counter() + seconds
-        while time.perf_counter() < end_time:
-            if self._stop_event.is_set(): break
-            time.sleep(0.001)
+                self._window_match = active_window is not None and self._title_re.search(active_window.title) is not None
+            except Exception: self._window_match = False
+            self._window_check_expiry = now + WINDOW_CHECK_TTL_S
+        return self._window_match
 
 # --- PlaybackWorker Class ---
 # This QThread plays back a recorded sequence of mouse clicks.
 class PlaybackWorker(QtCore.QThread):
-    sig_finished = QtCore.pyqtSignal()
     sig_update_status = QtCore.pyqtSignal(str)
 
     def __init__(self, sequence: list, repetitions: int, parent=None):
@@ -476,29 +673,24 @@ class PlaybackWorker(QtCore.QThread):
         self.sequence = sequence
         self.repetitions = repetitions
         self._stop_event = threading.Event()
-        self.mouse = MouseController()
+        self.mouse = SHARED_MOUSE
 
     def stop(self):
         self._stop_event.set()
 
     def run(self):
-        if not self.sequence:
-            self.sig_finished.emit()
-            return
+        if not self.sequence: return
 
         rep_count = 0
         while not self._stop_event.is_set():
             for event in self.sequence:
-                if self._stop_event.is_set(): break
-
                 # Wait for the recorded delay
                 delay = event.get('delay', 0.1)
-                self._sleep_interruptible(delay)
-                if self._stop_event.is_set(): break
+                if self._sleep_interruptible(delay): break
 
                 # Perform the click
                 self.mouse.position = (event['x'], event['y'])
-                self._sleep_interruptible(0.01) # Small delay to ensure position is set
+                if self._sleep_interruptible(0.01): break # Small delay to ensure position is set
                 button = MouseButton.left if event['button'] == 'left' else MouseButton.right
                 self.mouse.click(button, 1)
 
@@ -506,22 +698,29 @@ class PlaybackWorker(QtCore.QThread):
             if self.repetitions > 0 and rep_count >= self.repetitions:
                 break
 
-        self.sig_finished.emit()
-
-    def _sleep_interruptible(self, seconds: float):
-        self._stop_event.wait(seconds)
+    # Sleeps for the given time; returns True as soon as the worker is stopped.
+    def _sleep_interruptible(self, seconds: float) -> bool:
+        return self._stop_event.wait(seconds)
 
 
 # --- AntiAfkWorker Class ---
 # This QThread performs Anti-AFK actions at random intervals in the background.
 class AntiAfkWorker(QtCore.QThread):
-    sig_finished = QtCore.pyqtSignal()
     def __init__(self, cfg: AntiAfkConfig, parent=None):
         super().__init__(parent)
         self.cfg = cfg
         self._stop_event = threading.Event()
-        self.mouse = MouseController()
-        self.keyboard = KeyboardController()
+        self.mouse = SHARED_MOUSE
+        self.keyboard = SHARED_KEYBOARD
+        # Character keys are resolved to KeyCodes once instead of on every press and release.
+        self._keys = [KeyCode.from_char(key) if isinstance(key, str) else key for key in cfg.keys_to_press]
+        # Enabled actions are resolved once; run() only pauses between the ones that actually happen.
+        self._actions = [action for enabled, action in (
+            (cfg.move_mouse, self._move_mouse),
+            (cfg.click_mouse, self._click_mouse),
+            (cfg.scroll_mouse, self._scroll_mouse),
+            (cfg.press_keys and bool(self._keys), self._press_key),
+        ) if enabled]
 
     # Gracefully stops the worker thread.
     def stop(self): self._stop_event.set()
@@ -561,75 +760,108 @@ class AntiAfkWorker(QtCore.QThread):
                 y = (1-t)**3*start_pos[1] + 3*(1-t)**2*t*c1y + 3*(1-t)*t**2*c2y + t**3*end_pos[1]
 
             self.mouse.position = (int(x), int(y))
-            time.sleep(0.01)
+            if self._stop_event.wait(0.01): return
+
+    # --- Anti-AFK Actions ---
+    # Each action receives the cursor position from the start of the current cycle.
+    def _move_mouse(self, start_pos):
+        offset_x = random.randint(-self.cfg.mouse_range, self.cfg.mouse_range)
+        offset_y = random.randint(-self.cfg.mouse_range, self.cfg.mouse_range)
+        if self.cfg.use_human_like_move:
+            end_pos = (start_pos[0] + offset_x, start_pos[1] + offset_y)
+            self._perform_human_like_move(start_pos, end_pos)
+        else:
+            self.mouse.move(offset_x, offset_y)
+
+    def _click_mouse(self, start_pos):
+        self.mouse.click(random.choice([MouseButton.left, MouseButton.right]), 1)
+
+    def _scroll_mouse(self, start_pos):
+        self.mouse.scroll(0, random.choice([-1, 1]))
+
+    def _press_key(self, start_pos):
+        key_to_press = random.choice(self._keys)
+        self.keyboard.press(key_to_press)
+        self._stop_event.wait(AFK_ACTION_GAP_S)
+        self.keyboard.release(key_to_press)
+
+    # Returns the mouse to its position from the start of the cycle. A stopped worker jumps straight
+    # there, since the human-like move gives up as soon as the stop event is set.
+    def _return_to_start(self, start_pos):
+        if self.cfg.use_human_like_move and not self._stop_event.is_set():
+            self._perform_human_like_move(self.mouse.position, start_pos)
+        self.mouse.position = start_pos
+
+    # Checks whether any input reached the system after the given perf_counter() timestamp.
+    # Always False where idle time isn't available, so the worker then acts on every cycle.
+    @staticmethod
+    def _user_was_active(since):
+        idle_s = get_idle_seconds()
+        if idle_s is None: return False
+        return idle_s + AFK_ACTIVITY_TOLERANCE_S < time.perf_counter() - since
 
     # Main entry point for the thread's execution.
     def run(self):
+        actions = self._actions
+        return_to_start = self.cfg.return_to_start
+        last_index = len(actions) - 1 + return_to_start # The return also follows a gap.
+        wait = self._stop_event.wait
+        last_actions_end = time.perf_counter()
         while not self._stop_event.is_set():
             # Wait for a random interval.
-            wait_time = random.uniform(self.cfg.min_interval_s, self.cfg.max_interval_s)
-            if self._stop_event.wait(wait_time):
-                break
+            if wait(random.uniform(self.cfg.min_interval_s, self.cfg.max_interval_s)): break
 
-            start_pos = self.mouse.position
+            # The user isn't AFK if real input arrived after our own last actions (or the last check).
+            if self.cfg.skip_when_user_active and self._user_was_active(last_actions_end):
+                last_actions_end = time.perf_counter()
+                continue
 
-            # Perform enabled actions.
-            if self.cfg.move_mouse:
-                offset_x = random.randint(-self.cfg.mouse_range, self.cfg.mouse_range)
-                offset_y = random.randint(-self.cfg.mouse_range, self.cfg.mouse_range)
-
-                if self.cfg.use_human_like_move:
-                    end_pos = (start_pos[0] + offset_x, start_pos[1] + offset_y)
-                    self._perform_human_like_move(start_pos, end_pos)
-                else:
-                    self.mouse.move(offset_x, offset_y)
-
-                self._sleep_interruptible(0.1)
-
-            if self.cfg.click_mouse:
-                button_to_click = random.choice([MouseButton.left, MouseButton.right])
-                self.mouse.click(button_to_click, 1)
-                self._sleep_interruptible(0.1)
-
-            if self.cfg.scroll_mouse:
-                scroll_dir = random.choice([-1, 1])
-                self.mouse.scroll(0, scroll_dir)
-                self._sleep_interruptible(0.1)
-
-            if self.cfg.press_keys and self.cfg.keys_to_press:
-                key_to_press = random.choice(self.cfg.keys_to_press)
-                self.keyboard.press(key_to_press)
-                self._sleep_interruptible(0.1)
-                self.keyboard.release(key_to_press)
-
-            # Return mouse to its original position if enabled.
-            if self.cfg.return_to_start:
-                if self.cfg.use_human_like_move:
-                    current_pos = self.mouse.position
-                    self._perform_human_like_move(current_pos, start_pos)
-                else:
-                    self.mouse.position = start_pos
-
-        self.sig_finished.emit()
-
-    # An interruptible sleep implementation.
-    def _sleep_interruptible(self, seconds: float):
-        end_time = time.perf_counter() + seconds
-        while time.perf_counter() < end_time:
-            if self._stop_event.is_set(): break
-            time.sleep(0.001)
+            # Perform enabled actions with a short gap between consecutive ones.
+            start_pos = self.mouse.position
+            for i, action in enumerate(actions):
+                action(start_pos)
+                if i < last_index and wait(AFK_ACTION_GAP_S): break
+            # Runs on the stop path too, so stopping mid-cycle never leaves the cursor displaced.
+            if return_to_start: self._return_to_start(start_pos)
+            last_actions_end = time.perf_counter()
 
 # ==================================================================================================
 #                                         MAIN WINDOW
 # ==================================================================================================
+# Blocks the signals of the given objects for the duration of the block, restoring their previous state.
+@contextlib.contextmanager
+def signals_blocked(*objects):
+    blockers = [QtCore.QSignalBlocker(obj) for obj in objects]
+    try: yield
+    finally:
+        for blocker in blockers: blocker.unblock()
+
 class MainWindow(QtWidgets.QMainWindow):
     # --- Custom Signals ---
     sig_start_clicking = QtCore.pyqtSignal(MouseButton)
     sig_stop_clicking = QtCore.pyqtSignal()
     sig_toggle_armed = QtCore.pyqtSignal()
-    sig_trigger_action = QtCore.pyqtSignal()
-    sig_toggle_afk = QtCore.pyqtSignal()
     sig_log_message = QtCore.pyqtSignal(str)
+    sig_key_char = QtCore.pyqtSignal(str)
+    sig_emergency_stop = QtCore.pyqtSignal()
+
+    # --- Profile Defaults ---
+    # Merged once under a loaded profile so the loader can use plain lookups.
+    _DEFAULTS = {
+        "lmb_cps": 12.0, "lmb_variation": True, "lmb_jitter": 8, "lmb_click_type": 1,
+        "rmb_cps": 8.0, "rmb_variation": True, "rmb_jitter": 12, "rmb_click_type": 1,
+        "activation_mode": "hold", "toggle_button": "left", "burst_clicks": 3, "burst_delay": 50,
+        "use_fixed_pos": False, "fixed_x": 0, "fixed_y": 0, "click_limit": 0,
+        "limit_window": False, "window_title": "Minecraft", "activation_key": "r", "start_delay": 0.0,
+        "always_on_top": False, "playback_reps": 0,
+        "autoclicker_enabled": False, "afk_enabled": False, "language": "en", "theme": "dark",
+        "emergency_key": "esc", "accent_color": DEFAULT_ACCENT_COLOR,
+        "afk_min_interval": 10, "afk_max_interval": 15, "afk_move_mouse": True, "afk_mouse_range": 5,
+        "afk_return_to_start": False, "afk_click_mouse": False, "afk_scroll_mouse": False, "afk_press_keys": False, "afk_skip_when_active": False,
+        "afk_key_w": False, "afk_key_a": False, "afk_key_s": False, "afk_key_d": False, "afk_key_space": False,
+        "afk_custom_keys": "", "afk_hotkey": "p", "afk_use_human_moves": False,
+        "afk_human_move_mode_index": 0, "afk_human_move_duration": 0.3,
+    }
 
     # --- Initialization ---
     def __init__(self):
@@ -641,41 +873,107 @@ class MainWindow(QtWidgets.QMainWindow):
         self.afk_worker: AntiAfkWorker | None = None
         self.playback_worker: PlaybackWorker | None = None
         self.is_armed = False
-        self.programmatic_click = False
-        self.capture_timer = None
-        self.capture_countdown = 0
+        self._programmatic_events = 0 # Mouse events generated by ClickWorker that the mouse hook should ignore.
+        self._programmatic_lock = threading.Lock()
+        self.mouse_listener = None # Only runs while it's needed, see _update_mouse_listener.
         self.is_recording = False
         self.recorded_sequence = []
         self.last_click_time = 0
 
+        # Coalesces bursts of widget changes (e.g. dragging a slider) into a single settings write.
+        self._save_timer = QtCore.QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(SAVE_DEBOUNCE_MS)
+        self._save_timer.timeout.connect(self._write_settings)
+
+        # Coalesces back-to-back theme changes into a single stylesheet rebuild and repolish.
+        self._theme_timer = QtCore.QTimer(self)
+        self._theme_timer.setSingleShot(True)
+        self._theme_timer.setInterval(THEME_DEBOUNCE_MS)
+        self._theme_timer.timeout.connect(self._update_theme_impl)
+        self._theme_key = None # (is_dark, accent RGB) the current stylesheet was built for.
+
         # --- Load Settings & Theming ---
         self.settings = load_settings()
         self.accent_color = QtGui.QColor(self.settings.get("accent_color", DEFAULT_ACCENT_COLOR))
-        self.current_language = self.settings.get("language", "en")
+        self._accent_hex = self.accent_color.name()
+        self._set_language(self.settings.get("language", "en"))
         self.current_theme = self.settings.get("theme", "dark")
 
         # --- UI and Listener Setup ---
         self._build_ui()
+        self._connect_text_caches()
         self._load_profiles_to_ui()
         self._load_active_profile_to_ui()
-        self._update_theme()
+        self._connect_signals_for_saving()
+        self._update_theme_impl() # Applied synchronously: the integrity check reads the styled copyright label.
         self._retranslate_ui()
         self._verify_integrity()
 
         # --- Connect Signals to Slots ---
-        self.sig_start_clicking.connect(self.on_start_clicking)
-        self.sig_stop_clicking.connect(self.on_stop_clicking)
-        self.sig_toggle_armed.connect(self.on_toggle_armed)
-        self.sig_trigger_action.connect(self.on_trigger_action)
-        self.sig_toggle_afk.connect(self.on_toggle_afk_worker)
-        self.sig_log_message.connect(self._on_log_message)
+        # These are emitted from the pynput listener threads, so they are always queued onto the GUI
+        # thread; the slots run later and must not assume anything about the emitting thread.
+        queued = QtCore.Qt.ConnectionType.QueuedConnection
+        self.sig_start_clicking.connect(self.on_start_clicking, queued)
+        self.sig_stop_clicking.connect(self.on_stop_clicking, queued)
+        self.sig_toggle_armed.connect(self.on_toggle_armed, queued)
+        self.sig_log_message.connect(self._on_log_message, queued)
+        self.sig_key_char.connect(self._handle_key_char, queued)
+        self.sig_emergency_stop.connect(self._on_emergency_stop, queued)
 
         self._start_listeners()
         self.sig_log_message.emit("Application started.")
 
-    # --- Translation Helper ---
+    # --- Translation Helpers ---
+    # The active language's table is resolved once per language change rather than on every lookup.
+    def _set_language(self, language):
+        self.current_language = language
+        self._lang_map = TRANSLATIONS.get(language, TRANSLATIONS['en'])
+        self._status_cache = {}
+
     def _tr(self, key):
-        return TRANSLATIONS.get(self.current_language, TRANSLATIONS['en']).get(key, f"_{key}_")
+        return self._lang_map.get(key, f"_{key}_")
+
+    # Status texts are formatted once per language and accent color, then reused on every state change.
+    def _set_status(self, key):
+        text = self._status_cache.get(key)
+        if text is None: text = self._status_cache[key] = self._tr(key).format(color=self._accent_hex)
+        self.status_label.setText(text)
+
+    # --- Line Edit Text Caches ---
+    # Keeps processed copies of frequently read QLineEdit texts so summaries and info texts
+    # don't have to query the widgets on every refresh.
+    def _connect_text_caches(self):
+        self.activation_key_edit.textChanged.connect(lambda text: setattr(self, '_activation_key_text', (text or 'r').upper()))
+        self.afk_hotkey_edit.textChanged.connect(lambda text: setattr(self, '_afk_hotkey_text', (text or 'p').upper()))
+        self.emergency_key_edit.textChanged.connect(lambda text: setattr(self, '_emergency_key_text', (text or 'esc').upper()))
+        self.emergency_key_edit.textChanged.connect(lambda text: setattr(self, '_emergency_key', (text or 'esc').lower()))
+        self.afk_custom_keys_edit.textChanged.connect(lambda text: setattr(self, '_afk_custom_keys_text', text))
+        self.activation_key_edit.textChanged.connect(self._rebuild_hotkey_map)
+        self.afk_hotkey_edit.textChanged.connect(self._rebuild_hotkey_map)
+        self._focus_in_text_input = False
+        QtWidgets.QApplication.instance().focusChanged.connect(self._on_focus_changed)
+        self._refresh_text_caches()
+
+    # Re-reads all cached texts (needed after loading with signals blocked).
+    def _refresh_text_caches(self):
+        self._activation_key_text = (self.activation_key_edit.text() or 'r').upper()
+        self._afk_hotkey_text = (self.afk_hotkey_edit.text() or 'p').upper()
+        self._emergency_key_text = (self.emergency_key_edit.text() or 'esc').upper()
+        self._emergency_key = (self.emergency_key_edit.text() or 'esc').lower() # Compared against by the key listener.
+        self._afk_custom_keys_text = self.afk_custom_keys_edit.text()
+        self._rebuild_hotkey_map()
+
+    # Maps each lowercase hotkey char to its handler so the key listener does a single lookup.
+    def _rebuild_hotkey_map(self, *args):
+        self._hotkey_map = {
+            (self.activation_key_edit.text() or 'r').lower(): self._on_activation_hotkey,
+            (self.afk_hotkey_edit.text() or 'p').lower(): self._on_afk_hotkey, # Takes precedence if both keys are the same.
+        }
+
+    # Tracks whether typing goes into a text field, in which case hotkeys are ignored.
+    def _on_focus_changed(self, old, now):
+        self._focus_in_text_input = isinstance(now, (QtWidgets.QLineEdit, QPlainTextEdit))
 
     # =====================================================================
     # UI Building
@@ -696,10 +994,11 @@ class MainWindow(QtWidgets.QMainWindow):
         log_tab = QtWidgets.QWidget()
         settings_tab = QtWidgets.QWidget()
 
-        self.tab_widget.addTab(autoclicker_tab, self.style().standardIcon(QStyle.StandardPixmap.SP_ComputerIcon), "")
-        self.tab_widget.addTab(antiafk_tab, self.style().standardIcon(QStyle.StandardPixmap.SP_DialogYesButton), "")
-        self.tab_widget.addTab(log_tab, self.style().standardIcon(QStyle.StandardPixmap.SP_FileDialogInfoView), "")
-        self.tab_widget.addTab(settings_tab, self.style().standardIcon(QStyle.StandardPixmap.SP_FileDialogDetailedView), "")
+        # Tab icons are resolved once and reused when the UI is retranslated.
+        style, SP = self.style(), QStyle.StandardPixmap
+        self._tab_icons = tuple(style.standardIcon(pixmap) for pixmap in (SP.SP_ComputerIcon, SP.SP_DialogYesButton, SP.SP_FileDialogInfoView, SP.SP_FileDialogDetailedView))
+        for tab, icon in zip((autoclicker_tab, antiafk_tab, log_tab, settings_tab), self._tab_icons):
+            self.tab_widget.addTab(tab, icon, "")
 
         # Populate each tab with its specific widgets.
         self._populate_autoclicker_tab(autoclicker_tab)
@@ -707,6 +1006,29 @@ class MainWindow(QtWidgets.QMainWindow):
         self._populate_log_tab(log_tab)
         self._populate_settings_tab(settings_tab)
 
+        # Checkboxes that enable/disable a group of dependent widgets share one slot.
+        self._enable_groups = {
+            self.lmb_variation: (self.lmb_jitter,),
+            self.rmb_variation: (self.rmb_jitter,),
+            self.fixed_pos_check: (self.fixed_pos_x_spin, self.fixed_pos_y_spin, self.capture_pos_button),
+            self.limit_window_check: (self.window_title_edit,),
+            self.afk_move_mouse_check: (self.mouse_movement_box,),
+            self.afk_press_keys_check: (self.key_press_box,),
+            self.afk_use_human_moves_check: (self.afk_human_move_mode_combo, self.afk_human_move_duration_spin),
+        }
+        for check in self._enable_groups: check.toggled.connect(self._apply_enable_group)
+
+        # The rich-text info labels are only filled while their box is expanded (see _update_info_texts).
+        self._info_labels = {
+            self.autoclicker_info_box: (self.autoclicker_info_label, 'autoclicker_info_text'),
+            self.antiafk_info_box: (self.antiafk_info_label, 'antiafk_info_text'),
+        }
+        self._stale_info_boxes = set(self._info_labels)
+        for box in self._info_labels: box.toggled.connect(self._on_info_box_toggled)
+
+        # Every widget _load_settings_to_ui writes to, plus the profile combo whose blocked state marks a reload.
+        self._loaded_widgets = tuple(dict.fromkeys(widget for widget, *_ in self._profile_setting_bindings())) + (self.language_combo, self.theme_combo, self.profiles_combo)
+
         # Status label at the bottom.
         self.status_label = QtWidgets.QLabel()
         self.status_label.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
@@ -728,6 +1050,9 @@ class MainWindow(QtWidgets.QMainWindow):
         mouse_buttons_layout = QtWidgets.QHBoxLayout()
         self.lmb_box = self._create_mouse_button_group(self._tr('lmb_box_title'))
         self.rmb_box = self._create_mouse_button_group(self._tr('rmb_box_title'))
+        # Direct references to the per-button settings widgets; the rest of the window uses only these.
+        self.lmb_slider, self.lmb_variation, self.lmb_jitter, self.lmb_click_type = (self.lmb_box.widgets[k] for k in ('slider', 'variation', 'jitter', 'click_type'))
+        self.rmb_slider, self.rmb_variation, self.rmb_jitter, self.rmb_click_type = (self.rmb_box.widgets[k] for k in ('slider', 'variation', 'jitter', 'click_type'))
         mouse_buttons_layout.addWidget(self.lmb_box)
         mouse_buttons_layout.addWidget(self.rmb_box)
         controls_layout.addLayout(mouse_buttons_layout)
@@ -740,6 +1065,9 @@ class MainWindow(QtWidgets.QMainWindow):
         self.burst_mode_radio = QtWidgets.QRadioButton()
         mode_layout = QtWidgets.QHBoxLayout()
         mode_layout.addWidget(self.hold_mode_radio); mode_layout.addWidget(self.toggle_mode_radio); mode_layout.addWidget(self.burst_mode_radio)
+        self.mode_group = QtWidgets.QButtonGroup(self)
+        for mode_id, radio in enumerate((self.hold_mode_radio, self.toggle_mode_radio, self.burst_mode_radio)): self.mode_group.addButton(radio, mode_id)
+        self.hold_mode_radio.setChecked(True)
         self.activation_mode_label = QtWidgets.QLabel()
         global_settings_layout.addRow(self.activation_mode_label, mode_layout)
 
@@ -851,10 +1179,13 @@ class MainWindow(QtWidgets.QMainWindow):
         self.afk_click_mouse_check = QtWidgets.QCheckBox()
         self.afk_scroll_mouse_check = QtWidgets.QCheckBox()
         self.afk_press_keys_check = QtWidgets.QCheckBox()
+        self.afk_skip_when_active_check = QtWidgets.QCheckBox()
         afk_actions_layout.addRow(self.afk_move_mouse_check)
         afk_actions_layout.addRow(self.afk_click_mouse_check)
         afk_actions_layout.addRow(self.afk_scroll_mouse_check)
         afk_actions_layout.addRow(self.afk_press_keys_check)
+        afk_actions_layout.addRow(self.afk_skip_when_active_check)
+        self.afk_skip_when_active_check.setVisible(_GetLastInputInfo is not None) # Needs the Windows idle query.
         controls_layout.addWidget(self.antiafk_actions_box)
 
         # Panel 2: Ustawienia Ruchu Myszy
@@ -907,9 +1238,6 @@ class MainWindow(QtWidgets.QMainWindow):
         controls_layout.addWidget(self.hotkey_box_afk)
 
         # Połączenia sygnałów dla nowej struktury
-        self.afk_move_mouse_check.toggled.connect(self.mouse_movement_box.setEnabled)
-        self.afk_press_keys_check.toggled.connect(self.key_press_box.setEnabled)
-        self.afk_use_human_moves_check.toggled.connect(self._on_afk_use_human_move_toggled)
 
         controls_layout.addStretch()
 
@@ -1034,7 +1362,6 @@ class MainWindow(QtWidgets.QMainWindow):
 
         self.limit_window_check = QtWidgets.QCheckBox()
         self.window_title_edit = QtWidgets.QLineEdit()
-        self.limit_window_check.toggled.connect(self.window_title_edit.setEnabled)
         settings_layout.addRow(self.limit_window_check)
         settings_layout.addRow(self.window_title_edit)
 
@@ -1084,7 +1411,6 @@ class MainWindow(QtWidgets.QMainWindow):
         layout.addRow(variation_check)
         jitter_label_widget = QtWidgets.QLabel(self._tr('jitter_label'))
         layout.addRow(jitter_label_widget, jitter_spin)
-        variation_check.toggled.connect(jitter_spin.setEnabled)
         box.widgets = {'slider': cps_slider, 'label': cps_value_label, 'variation': variation_check, 'jitter': jitter_spin, 'cps_label': cps_label_widget, 'jitter_label': jitter_label_widget, 'click_type': click_type_combo, 'click_type_label': click_type_label_widget}
         cps_slider.valueChanged.connect(lambda val, label=cps_value_label: label.setText(f"{val/10.0:.1f}"))
         return box
@@ -1095,6 +1421,9 @@ class MainWindow(QtWidgets.QMainWindow):
         self.toggle_lmb_radio = QtWidgets.QRadioButton()
         self.toggle_rmb_radio = QtWidgets.QRadioButton()
         button_layout = QtWidgets.QHBoxLayout(); button_layout.addWidget(self.toggle_lmb_radio); button_layout.addWidget(self.toggle_rmb_radio)
+        self.toggle_button_group = QtWidgets.QButtonGroup(self)
+        self.toggle_button_group.addButton(self.toggle_lmb_radio, 0); self.toggle_button_group.addButton(self.toggle_rmb_radio, 1)
+        self.toggle_lmb_radio.setChecked(True)
         self.click_with_label = QtWidgets.QLabel()
         layout.addRow(self.click_with_label, button_layout)
         return widget
@@ -1123,7 +1452,6 @@ class MainWindow(QtWidgets.QMainWindow):
         pos_layout.addWidget(self.capture_pos_button)
         layout.addRow(self.fixed_pos_check)
         layout.addRow(pos_layout)
-        self.fixed_pos_check.toggled.connect(lambda checked: [w.setEnabled(checked) for w in [self.fixed_pos_x_spin, self.fixed_pos_y_spin, self.capture_pos_button]])
         self.capture_pos_button.clicked.connect(self._capture_mouse_position)
         return widget
 
@@ -1131,56 +1459,78 @@ class MainWindow(QtWidgets.QMainWindow):
     # Settings Persistence
     # =====================================================================
 
-    # Connects all relevant UI widget signals to the save function.
+    # Lists every persisted widget with its profile key and, where the stored value isn't simply
+    # the widget's own value, a getter that produces it.
+    def _profile_setting_bindings(self):
+        return [
+            (self.lmb_slider, "lmb_cps", lambda: self.lmb_slider.value() / 10.0), (self.lmb_variation, "lmb_variation"), (self.lmb_jitter, "lmb_jitter"), (self.lmb_click_type, "lmb_click_type", lambda: self.lmb_click_type.currentIndex() + 1),
+            (self.rmb_slider, "rmb_cps", lambda: self.rmb_slider.value() / 10.0), (self.rmb_variation, "rmb_variation"), (self.rmb_jitter, "rmb_jitter"), (self.rmb_click_type, "rmb_click_type", lambda: self.rmb_click_type.currentIndex() + 1),
+            (self.activation_key_edit, "activation_key"), (self.start_delay_spin, "start_delay"), (self.click_limit_spin, "click_limit"),
+            (self.limit_window_check, "limit_window"), (self.window_title_edit, "window_title"), (self.always_on_top_checkbox, "always_on_top"),
+            (self.mode_group, "activation_mode", lambda: ACTIVATION_MODES[self.mode_group.checkedId()]),
+            (self.toggle_button_group, "toggle_button", lambda: "right" if self.toggle_button_group.checkedId() == 1 else "left"),
+            (self.burst_clicks_spin, "burst_clicks"), (self.burst_delay_spin, "burst_delay"),
+            (self.fixed_pos_check, "use_fixed_pos"), (self.fixed_pos_x_spin, "fixed_x"), (self.fixed_pos_y_spin, "fixed_y"), (self.playback_reps_spin, "playback_reps"),
+            (self.afk_min_interval_spin, "afk_min_interval"), (self.afk_max_interval_spin, "afk_max_interval"),
+            (self.afk_move_mouse_check, "afk_move_mouse"), (self.afk_use_human_moves_check, "afk_use_human_moves"),
+            (self.afk_human_move_mode_combo, "afk_human_move_mode_index"), (self.afk_human_move_duration_spin, "afk_human_move_duration"),
+            (self.afk_mouse_range_spin, "afk_mouse_range"), (self.afk_return_to_start_check, "afk_return_to_start"),
+            (self.afk_click_mouse_check, "afk_click_mouse"), (self.afk_scroll_mouse_check, "afk_scroll_mouse"), (self.afk_press_keys_check, "afk_press_keys"),
+            (self.afk_skip_when_active_check, "afk_skip_when_active"),
+            (self.afk_key_w, "afk_key_w"), (self.afk_key_a, "afk_key_a"), (self.afk_key_s, "afk_key_s"), (self.afk_key_d, "afk_key_d"), (self.afk_key_space, "afk_key_space"),
+            (self.afk_custom_keys_edit, "afk_custom_keys"), (self.afk_hotkey_edit, "afk_hotkey"),
+            (self.emergency_key_edit, "emergency_key"), (self.autoclicker_enabled_check, "autoclicker_enabled"), (self.afk_enabled_check, "afk_enabled"),
+        ]
+
+    # Connects all relevant UI widget signals so each change updates only its own profile key.
     def _connect_signals_for_saving(self):
-        autoclicker_widgets = [self.lmb_box.widgets['slider'], self.lmb_box.widgets['variation'], self.lmb_box.widgets['jitter'], self.lmb_box.widgets['click_type'], self.rmb_box.widgets['slider'], self.rmb_box.widgets['variation'], self.rmb_box.widgets['jitter'], self.rmb_box.widgets['click_type'], self.activation_key_edit, self.start_delay_spin, self.click_limit_spin, self.limit_window_check, self.window_title_edit, self.always_on_top_checkbox, self.hold_mode_radio, self.toggle_mode_radio, self.burst_mode_radio, self.toggle_lmb_radio, self.toggle_rmb_radio, self.burst_clicks_spin, self.burst_delay_spin, self.fixed_pos_check, self.fixed_pos_x_spin, self.fixed_pos_y_spin, self.playback_reps_spin]
-        antiafk_widgets = [self.afk_min_interval_spin, self.afk_max_interval_spin, self.afk_move_mouse_check, self.afk_use_human_moves_check, self.afk_human_move_mode_combo, self.afk_human_move_duration_spin, self.afk_mouse_range_spin, self.afk_return_to_start_check, self.afk_click_mouse_check, self.afk_scroll_mouse_check, self.afk_press_keys_check, self.afk_key_w, self.afk_key_a, self.afk_key_s, self.afk_key_d, self.afk_key_space, self.afk_custom_keys_edit, self.afk_hotkey_edit]
-        settings_widgets = [self.emergency_key_edit, self.autoclicker_enabled_check, self.afk_enabled_check]
-        all_widgets = autoclicker_widgets + antiafk_widgets + settings_widgets
-        for widget in all_widgets:
+        for widget, key, *getter in self._profile_setting_bindings():
             if isinstance(widget, (QtWidgets.QSpinBox, QtWidgets.QDoubleSpinBox, QtWidgets.QSlider)):
-                widget.valueChanged.connect(self._save_active_profile_from_ui)
-                widget.valueChanged.connect(self._update_summaries)
+                signal, value = widget.valueChanged, widget.value
+                if isinstance(widget, QtWidgets.QSlider): widget.sliderReleased.connect(self._flush_pending_save)
             elif isinstance(widget, (QtWidgets.QCheckBox, QtWidgets.QRadioButton)):
-                widget.toggled.connect(self._save_active_profile_from_ui)
-                widget.toggled.connect(self._update_summaries)
+                signal, value = widget.toggled, widget.isChecked
             elif isinstance(widget, QtWidgets.QLineEdit):
-                widget.textChanged.connect(self._save_active_profile_from_ui)
-                widget.textChanged.connect(self._update_summaries)
+                signal, value = widget.textChanged, widget.text
             elif isinstance(widget, QtWidgets.QComboBox):
-                widget.currentIndexChanged.connect(self._save_active_profile_from_ui)
-                widget.currentIndexChanged.connect(self._update_summaries)
-
-    # Saves current settings to the active profile.
-    def _save_active_profile_from_ui(self, *args):
-        if self.profiles_combo.blockSignals(True):
-            self.profiles_combo.blockSignals(False)
-            return
-
+                signal, value = widget.currentIndexChanged, widget.currentIndex
+            elif isinstance(widget, QtWidgets.QButtonGroup):
+                signal, value = widget.idClicked, widget.checkedId # One notification per choice, not one per radio.
+            signal.connect(functools.partial(self._update_profile_setting, key, getter[0] if getter else value))
+            signal.connect(self._update_summaries)
+
+    # Stores a single changed setting in the active profile and schedules a write.
+    def _update_profile_setting(self, key, getter, *args):
+        if self.profiles_combo.signalsBlocked(): return # Profiles are being reloaded.
         current_profile_name = self.profiles_combo.currentText()
         if not current_profile_name: return
+        self.settings.setdefault("profiles", {}).setdefault(current_profile_name, {})[key] = getter()
+        self._save_timer.start()
 
-        profile_data = self._get_settings_from_ui()
+    # Writes a pending debounced save immediately (e.g. on slider release or close).
+    def _flush_pending_save(self):
+        if self._save_timer.isActive():
+            self._save_timer.stop()
+            self._write_settings()
 
-        if "profiles" not in self.settings: self.settings["profiles"] = {}
-        self.settings["profiles"][current_profile_name] = profile_data
-
-        save_settings(self.settings)
+    # Writes the in-memory settings to disk in the background.
+    def _write_settings(self):
+        save_settings_async(self.settings)
 
     # Gathers all current settings from the UI.
     def _get_settings_from_ui(self):
         return {
-            "lmb_cps": self.lmb_box.widgets['slider'].value()/10.0, "lmb_variation": self.lmb_box.widgets['variation'].isChecked(), "lmb_jitter": self.lmb_box.widgets['jitter'].value(), "lmb_click_type": self.lmb_box.widgets['click_type'].currentIndex() + 1,
-            "rmb_cps": self.rmb_box.widgets['slider'].value()/10.0, "rmb_variation": self.rmb_box.widgets['variation'].isChecked(), "rmb_jitter": self.rmb_box.widgets['jitter'].value(), "rmb_click_type": self.rmb_box.widgets['click_type'].currentIndex() + 1,
+            "lmb_cps": self.lmb_slider.value()/10.0, "lmb_variation": self.lmb_variation.isChecked(), "lmb_jitter": self.lmb_jitter.value(), "lmb_click_type": self.lmb_click_type.currentIndex() + 1,
+            "rmb_cps": self.rmb_slider.value()/10.0, "rmb_variation": self.rmb_variation.isChecked(), "rmb_jitter": self.rmb_jitter.value(), "rmb_click_type": self.rmb_click_type.currentIndex() + 1,
             "autoclicker_enabled": self.autoclicker_enabled_check.isChecked(),
-            "activation_mode": "toggle" if self.toggle_mode_radio.isChecked() else "burst" if self.burst_mode_radio.isChecked() else "hold",
-            "toggle_button": "right" if self.toggle_rmb_radio.isChecked() else "left",
+            "activation_mode": ACTIVATION_MODES[self.mode_group.checkedId()],
+            "toggle_button": "right" if self.toggle_button_group.checkedId() == 1 else "left",
             "burst_clicks": self.burst_clicks_spin.value(), "burst_delay": self.burst_delay_spin.value(),
             "use_fixed_pos": self.fixed_pos_check.isChecked(), "fixed_x": self.fixed_pos_x_spin.value(), "fixed_y": self.fixed_pos_y_spin.value(),
             "click_limit": self.click_limit_spin.value(),
             "limit_window": self.limit_window_check.isChecked(), "window_title": self.window_title_edit.text(), "activation_key": self.activation_key_edit.text(),
             "start_delay": self.start_delay_spin.value(), "always_on_top": self.always_on_top_checkbox.isChecked(),
-            "accent_color": self.accent_color.name(),
+            "accent_color": self._accent_hex,
             "language": self.current_language,
             "theme": self.current_theme,
             "emergency_key": self.emergency_key_edit.text(),
@@ -1192,6 +1542,7 @@ class MainWindow(QtWidgets.QMainWindow):
             "afk_click_mouse": self.afk_click_mouse_check.isChecked(),
             "afk_scroll_mouse": self.afk_scroll_mouse_check.isChecked(),
             "afk_press_keys": self.afk_press_keys_check.isChecked(),
+            "afk_skip_when_active": self.afk_skip_when_active_check.isChecked(),
             "afk_key_w": self.afk_key_w.isChecked(), "afk_key_a": self.afk_key_a.isChecked(), "afk_key_s": self.afk_key_s.isChecked(), "afk_key_d": self.afk_key_d.isChecked(), "afk_key_space": self.afk_key_space.isChecked(),
             "afk_custom_keys": self.afk_custom_keys_edit.text(),
             "afk_hotkey": self.afk_hotkey_edit.text(),
@@ -1201,61 +1552,69 @@ class MainWindow(QtWidgets.QMainWindow):
         }
 
     # Loads settings from a profile dict and applies them to the UI widgets.
-    def _load_settings_to_ui(self, s: dict):
-        for widget in self.findChildren(QtWidgets.QWidget): widget.blockSignals(True)
-
-        # --- Load AutoClicker Settings ---
-        self.lmb_box.widgets['slider'].setValue(int(s.get("lmb_cps", 12.0) * 10)); self.lmb_box.widgets['variation'].setChecked(s.get("lmb_variation", True)); self.lmb_box.widgets['jitter'].setValue(s.get("lmb_jitter", 8)); self.lmb_box.widgets['click_type'].setCurrentIndex(s.get("lmb_click_type", 1) - 1)
-        self.rmb_box.widgets['slider'].setValue(int(s.get("rmb_cps", 8.0) * 10)); self.rmb_box.widgets['variation'].setChecked(s.get("rmb_variation", True)); self.rmb_box.widgets['jitter'].setValue(s.get("rmb_jitter", 12)); self.rmb_box.widgets['click_type'].setCurrentIndex(s.get("rmb_click_type", 1) - 1)
-        mode = s.get("activation_mode", "hold"); self.toggle_mode_radio.setChecked(mode=="toggle"); self.burst_mode_radio.setChecked(mode=="burst"); self.hold_mode_radio.setChecked(mode=="hold")
-        self.toggle_rmb_radio.setChecked(s.get("toggle_button", "left") == "right"); self.toggle_lmb_radio.setChecked(s.get("toggle_button", "left") != "right")
-        self.burst_clicks_spin.setValue(s.get("burst_clicks", 3)); self.burst_delay_spin.setValue(s.get("burst_delay", 50))
-        self.fixed_pos_check.setChecked(s.get("use_fixed_pos", False)); self.fixed_pos_x_spin.setValue(s.get("fixed_x", 0)); self.fixed_pos_y_spin.setValue(s.get("fixed_y", 0))
-        self.click_limit_spin.setValue(s.get("click_limit", 0))
-        self.limit_window_check.setChecked(s.get("limit_window", False)); self.window_title_edit.setText(s.get("window_title", "Minecraft"))
-        self.activation_key_edit.setText(s.get("activation_key") or "r"); self.start_delay_spin.setValue(s.get("start_delay", 0.0)); self.always_on_top_checkbox.setChecked(s.get("always_on_top", False));
-        self.playback_reps_spin.setValue(s.get("playback_reps", 0))
-
-        # --- Load General Settings ---
-        self.autoclicker_enabled_check.setChecked(s.get("autoclicker_enabled", False))
-        self.afk_enabled_check.setChecked(s.get("afk_enabled", False))
-        self.current_language = s.get("language", "en")
-        self.language_combo.setCurrentIndex(1 if self.current_language == "pl" else 0)
-        self.current_theme = s.get("theme", "dark")
-        self.theme_combo.setCurrentIndex(1 if self.current_theme == "light" else 0)
-        self.emergency_key_edit.setText(s.get("emergency_key") or "esc")
-        self.accent_color = QtGui.QColor(s.get("accent_color", DEFAULT_ACCENT_COLOR))
-
-        # --- Load Anti-AFK Settings ---
-        self.afk_min_interval_spin.setValue(s.get("afk_min_interval", 10)); self.afk_max_interval_spin.setValue(s.get("afk_max_interval", 15))
-        self.afk_move_mouse_check.setChecked(s.get("afk_move_mouse", True)); self.afk_mouse_range_spin.setValue(s.get("afk_mouse_range", 5))
-        self.afk_return_to_start_check.setChecked(s.get("afk_return_to_start", False))
-        self.afk_click_mouse_check.setChecked(s.get("afk_click_mouse", False))
-        self.afk_scroll_mouse_check.setChecked(s.get("afk_scroll_mouse", False))
-        self.afk_press_keys_check.setChecked(s.get("afk_press_keys", False))
-        self.afk_key_w.setChecked(s.get("afk_key_w", False)); self.afk_key_a.setChecked(s.get("afk_key_a", False)); self.afk_key_s.setChecked(s.get("afk_key_s", False)); self.afk_key_d.setChecked(s.get("afk_key_d", False)); self.afk_key_space.setChecked(s.get("afk_key_space", False))
-        self.afk_custom_keys_edit.setText(s.get("afk_custom_keys", ""))
-        self.afk_hotkey_edit.setText(s.get("afk_hotkey") or "p")
-        self.afk_use_human_moves_check.setChecked(s.get("afk_use_human_moves", False))
-        self.afk_human_move_mode_combo.setCurrentIndex(s.get("afk_human_move_mode_index", 0))
-        self.afk_human_move_duration_spin.setValue(s.get("afk_human_move_duration", 0.3))
-
-        # --- Post-load UI adjustments ---
-        self._on_mode_changed()
-        self.lmb_box.widgets['jitter'].setEnabled(self.lmb_box.widgets['variation'].isChecked())
-        self.rmb_box.widgets['jitter'].setEnabled(self.rmb_box.widgets['variation'].isChecked())
-        self.window_title_edit.setEnabled(self.limit_window_check.isChecked())
-        self.mouse_movement_box.setEnabled(self.afk_move_mouse_check.isChecked())
-        self.key_press_box.setEnabled(self.afk_press_keys_check.isChecked())
-        self._on_afk_use_human_move_toggled(self.afk_use_human_moves_check.isChecked())
-        self._on_autoclicker_enabled_toggled(self.autoclicker_enabled_check.isChecked())
-        self._on_afk_enabled_toggled(self.afk_enabled_check.isChecked())
-
-        self._update_theme()
-        self._retranslate_ui()
-        self._update_summaries()
+    # Sets a line edit's text only when it actually changes. Numeric and check setters already
+    # no-op on equal values, but QLineEdit.setText() always resets the cursor, undo stack and layout.
+    @staticmethod
+    def _set_text_if_diff(edit, text):
+        if edit.text() != text: edit.setText(text)
 
-        for widget in self.findChildren(QtWidgets.QWidget): widget.blockSignals(False)
+    def _load_settings_to_ui(self, s: dict):
+        # Suppress signals and repaints while dozens of widgets change; the window repaints once at the end.
+        self.setUpdatesEnabled(False)
+        try:
+            with signals_blocked(*self._loaded_widgets):
+                s = {**self._DEFAULTS, **s}
+
+                # --- Load AutoClicker Settings ---
+                self.lmb_slider.setValue(int(s["lmb_cps"] * 10)); self.lmb_variation.setChecked(s["lmb_variation"]); self.lmb_jitter.setValue(s["lmb_jitter"]); self.lmb_click_type.setCurrentIndex(s["lmb_click_type"] - 1)
+                self.rmb_slider.setValue(int(s["rmb_cps"] * 10)); self.rmb_variation.setChecked(s["rmb_variation"]); self.rmb_jitter.setValue(s["rmb_jitter"]); self.rmb_click_type.setCurrentIndex(s["rmb_click_type"] - 1)
+                mode = s["activation_mode"]; self.mode_group.button(ACTIVATION_MODES.index(mode) if mode in ACTIVATION_MODES else 0).setChecked(True)
+                self.toggle_button_group.button(1 if s["toggle_button"] == "right" else 0).setChecked(True)
+                self.burst_clicks_spin.setValue(s["burst_clicks"]); self.burst_delay_spin.setValue(s["burst_delay"])
+                self.fixed_pos_check.setChecked(s["use_fixed_pos"]); self.fixed_pos_x_spin.setValue(s["fixed_x"]); self.fixed_pos_y_spin.setValue(s["fixed_y"])
+                self.click_limit_spin.setValue(s["click_limit"])
+                self.limit_window_check.setChecked(s["limit_window"]); self._set_text_if_diff(self.window_title_edit, s["window_title"])
+                self._set_text_if_diff(self.activation_key_edit, s["activation_key"] or "r"); self.start_delay_spin.setValue(s["start_delay"]); self.always_on_top_checkbox.setChecked(s["always_on_top"]);
+                self.playback_reps_spin.setValue(s["playback_reps"])
+
+                # --- Load General Settings ---
+                self.autoclicker_enabled_check.setChecked(s["autoclicker_enabled"])
+                self.afk_enabled_check.setChecked(s["afk_enabled"])
+                self._set_language(s["language"])
+                self.language_combo.setCurrentIndex(1 if self.current_language == "pl" else 0)
+                self.current_theme = s["theme"]
+                self.theme_combo.setCurrentIndex(1 if self.current_theme == "light" else 0)
+                self._set_text_if_diff(self.emergency_key_edit, s["emergency_key"] or "esc")
+                self.accent_color = QtGui.QColor(s["accent_color"])
+                self._accent_hex = self.accent_color.name()
+
+                # --- Load Anti-AFK Settings ---
+                self.afk_min_interval_spin.setValue(s["afk_min_interval"]); self.afk_max_interval_spin.setValue(s["afk_max_interval"])
+                self.afk_move_mouse_check.setChecked(s["afk_move_mouse"]); self.afk_mouse_range_spin.setValue(s["afk_mouse_range"])
+                self.afk_return_to_start_check.setChecked(s["afk_return_to_start"])
+                self.afk_click_mouse_check.setChecked(s["afk_click_mouse"])
+                self.afk_scroll_mouse_check.setChecked(s["afk_scroll_mouse"])
+                self.afk_press_keys_check.setChecked(s["afk_press_keys"])
+                self.afk_skip_when_active_check.setChecked(s["afk_skip_when_active"])
+                self.afk_key_w.setChecked(s["afk_key_w"]); self.afk_key_a.setChecked(s["afk_key_a"]); self.afk_key_s.setChecked(s["afk_key_s"]); self.afk_key_d.setChecked(s["afk_key_d"]); self.afk_key_space.setChecked(s["afk_key_space"])
+                self._set_text_if_diff(self.afk_custom_keys_edit, s["afk_custom_keys"])
+                self._set_text_if_diff(self.afk_hotkey_edit, s["afk_hotkey"] or "p")
+                self.afk_use_human_moves_check.setChecked(s["afk_use_human_moves"])
+                self.afk_human_move_mode_combo.setCurrentIndex(s["afk_human_move_mode_index"])
+                self.afk_human_move_duration_spin.setValue(s["afk_human_move_duration"])
+
+                # --- Post-load UI adjustments ---
+                self._refresh_text_caches()
+                self._on_mode_changed()
+                for check, widgets in self._enable_groups.items():
+                    for w in widgets: w.setEnabled(check.isChecked())
+                self._on_autoclicker_enabled_toggled(self.autoclicker_enabled_check.isChecked())
+                self._on_afk_enabled_toggled(self.afk_enabled_check.isChecked())
+
+                self._update_theme()
+                self._retranslate_ui()
+                self._update_summaries()
+        finally: self.setUpdatesEnabled(True) # Never leave the window frozen if a profile fails to load.
 
     # =====================================================================
     # Event Handling & Logic
@@ -1263,16 +1622,25 @@ class MainWindow(QtWidgets.QMainWindow):
 
     # --- Listener Setup ---
     def _start_listeners(self):
-        self.hold_mode_radio.toggled.connect(self._on_mode_changed)
-        self.toggle_mode_radio.toggled.connect(self._on_mode_changed)
-        self.burst_mode_radio.toggled.connect(self._on_mode_changed)
+        self.mode_group.idClicked.connect(self._on_mode_changed)
 
         self.activation_key_edit.textChanged.connect(self._update_info_texts)
         self.afk_hotkey_edit.textChanged.connect(self._update_info_texts)
         self.emergency_key_edit.textChanged.connect(self._update_info_texts)
 
         self.keyboard_listener = KeyboardListener(on_press=self._on_key_press); self.keyboard_listener.start()
-        self.mouse_listener = MouseListener(on_click=self._on_mouse_click); self.mouse_listener.start()
+        self._update_mouse_listener()
+
+    # The global mouse hook is only needed in hold mode and while recording; otherwise every click
+    # anywhere on the system would pay for a Python callback that returns straight away.
+    def _update_mouse_listener(self):
+        needed = self.is_recording or self.hold_mode_radio.isChecked()
+        if needed == (self.mouse_listener is not None): return
+        if needed:
+            with self._programmatic_lock: self._programmatic_events = 0 # Clicks made while unhooked were never seen.
+            self.mouse_listener = MouseListener(on_click=self._on_mouse_click); self.mouse_listener.start()
+        else:
+            self.mouse_listener.stop(); self.mouse_listener = None
 
     # --- Anti-AFK Worker Management ---
     def on_toggle_afk_worker(self):
@@ -1291,7 +1659,7 @@ class MainWindow(QtWidgets.QMainWindow):
         if self.afk_key_s.isChecked(): keys.append('s')
         if self.afk_key_d.isChecked(): keys.append('d')
         if self.afk_key_space.isChecked(): keys.append(Key.space)
-        if self.afk_custom_keys_edit.text(): keys.extend(list(self.afk_custom_keys_edit.text().lower()))
+        keys.extend(self._afk_custom_keys_text.lower())
 
         cfg = AntiAfkConfig(
             enabled=self.afk_enabled_check.isChecked(),
@@ -1301,21 +1669,22 @@ class MainWindow(QtWidgets.QMainWindow):
             click_mouse=self.afk_click_mouse_check.isChecked(),
             scroll_mouse=self.afk_scroll_mouse_check.isChecked(),
             press_keys=self.afk_press_keys_check.isChecked(), keys_to_press=keys,
+            skip_when_user_active=self.afk_skip_when_active_check.isChecked(),
             use_human_like_move=self.afk_use_human_moves_check.isChecked(),
             human_move_mode_index=self.afk_human_move_mode_combo.currentIndex(),
             human_move_duration=self.afk_human_move_duration_spin.value()
         )
         self.afk_worker = AntiAfkWorker(cfg)
-        self.afk_worker.sig_finished.connect(self.on_afk_worker_finished)
+        self.afk_worker.finished.connect(self.on_afk_worker_finished)
         self.afk_worker.start()
 
-        self.status_label.setText(self._tr('status_antiafk').format(color=self.accent_color.name()))
+        self._set_status('status_antiafk')
         self.tab_widget.setTabEnabled(0, False) # Disable Autoclicker Tab
         self.tab_widget.setTabEnabled(3, False) # Disable Settings Tab
 
     def on_afk_worker_finished(self):
         self.sig_log_message.emit("Anti-AFK stopped.")
-        self.status_label.setText(self._tr('status_stopped'))
+        self._set_status('status_stopped')
         self.afk_worker = None
         self.tab_widget.setTabEnabled(0, True)
         self.tab_widget.setTabEnabled(3, True)
@@ -1325,14 +1694,15 @@ class MainWindow(QtWidgets.QMainWindow):
     def on_start_clicking(self, button):
         if self.worker is not None: return
         self.sig_log_message.emit("AutoClicker started.")
-        is_burst = self.burst_mode_radio.isChecked()
-        is_toggle = self.toggle_mode_radio.isChecked()
+        mode = ACTIVATION_MODES[self.mode_group.checkedId()]
+        is_burst = mode == "burst"
+        is_toggle = mode == "toggle"
         cfg = ClickConfig(is_burst_mode=is_burst)
 
         if button == MouseButton.left:
-            cfg.cps=self.lmb_box.widgets['slider'].value()/10.0; cfg.use_random_variation=self.lmb_box.widgets['variation'].isChecked(); cfg.jitter_ms=self.lmb_box.widgets['jitter'].value(); cfg.click_type=self.lmb_box.widgets['click_type'].currentIndex() + 1
+            cfg.cps=self.lmb_slider.value()/10.0; cfg.use_random_variation=self.lmb_variation.isChecked(); cfg.jitter_ms=self.lmb_jitter.value(); cfg.click_type=self.lmb_click_type.currentIndex() + 1
         else:
-            cfg.cps=self.rmb_box.widgets['slider'].value()/10.0; cfg.use_random_variation=self.rmb_box.widgets['variation'].isChecked(); cfg.jitter_ms=self.rmb_box.widgets['jitter'].value(); cfg.click_type=self.rmb_box.widgets['click_type'].currentIndex() + 1
+            cfg.cps=self.rmb_slider.value()/10.0; cfg.use_random_variation=self.rmb_variation.isChecked(); cfg.jitter_ms=self.rmb_jitter.value(); cfg.click_type=self.rmb_click_type.currentIndex() + 1
 
         cfg.click_button = button
         cfg.limit_to_window=self.limit_window_check.isChecked(); cfg.window_title=self.window_title_edit.text()
@@ -1341,23 +1711,26 @@ class MainWindow(QtWidgets.QMainWindow):
         if is_burst: cfg.burst_clicks=self.burst_clicks_spin.value(); cfg.burst_delay_ms=self.burst_delay_spin.value()
 
         self.worker = ClickWorker(cfg, main_window=self)
-        self.worker.sig_finished.connect(self.on_stop_clicking)
-        self.worker.start()
+        self.worker.finished.connect(self._on_click_worker_finished)
+        self.worker.start(QtCore.QThread.Priority.TimeCriticalPriority) # Reduce scheduling jitter between clicks.
 
-        self.status_label.setText(self._tr('status_clicking').format(color=self.accent_color.name()))
+        self._set_status('status_clicking')
         self.tab_widget.setTabEnabled(1, False)
         self.tab_widget.setTabEnabled(3, False)
 
+    # Only asks the worker to stop; the UI is updated by _on_click_worker_finished once its thread has exited.
     @QtCore.pyqtSlot()
     def on_stop_clicking(self):
-        if self.worker:
-            self.sig_log_message.emit("AutoClicker stopped.")
-            self.worker.stop(); self.worker.wait(200); self.worker = None
+        if self.worker: self.worker.stop()
 
+    @QtCore.pyqtSlot()
+    def _on_click_worker_finished(self):
+        self.worker = None
+        self.sig_log_message.emit("AutoClicker stopped.")
         if self.hold_mode_radio.isChecked() and self.is_armed:
-            self.status_label.setText(self._tr('status_armed'))
+            self._set_status('status_armed')
         else:
-            self.status_label.setText(self._tr('status_stopped'))
+            self._set_status('status_stopped')
             self.is_armed = False
         self.tab_widget.setTabEnabled(1, True)
         self.tab_widget.setTabEnabled(3, True)
@@ -1366,17 +1739,18 @@ class MainWindow(QtWidgets.QMainWindow):
     # --- Record & Playback ---
     def _toggle_recording(self):
         self.is_recording = not self.is_recording
+        self._update_mouse_listener()
         if self.is_recording:
             self.sig_log_message.emit("Recording started...")
             self.recorded_sequence = []
             self.last_click_time = time.perf_counter()
-            self.status_label.setText(self._tr('status_recording'))
+            self._set_status('status_recording')
             self.record_button.setText(self._tr('stop_record_button'))
             self.tab_widget.setTabEnabled(1, False)
             self.tab_widget.setTabEnabled(3, False)
         else:
             self.sig_log_message.emit(f"Recording stopped. Clicks captured: {len(self.recorded_sequence)}.")
-            self.status_label.setText(self._tr('status_stopped'))
+            self._set_status('status_stopped')
             self.record_button.setText(self._tr('record_button'))
             self.recorded_clicks_count_label.setText(self._tr('recorded_clicks_label').format(count=len(self.recorded_sequence)))
             self.tab_widget.setTabEnabled(1, True)
@@ -1393,9 +1767,9 @@ class MainWindow(QtWidgets.QMainWindow):
             self.sig_log_message.emit("Playback started.")
             reps = self.playback_reps_spin.value()
             self.playback_worker = PlaybackWorker(self.recorded_sequence, reps)
-            self.playback_worker.sig_finished.connect(self._on_playback_finished)
+            self.playback_worker.finished.connect(self._on_playback_finished)
             self.playback_worker.start()
-            self.status_label.setText(self._tr('status_playback').format(color=self.accent_color.name()))
+            self._set_status('status_playback')
             self.playback_button.setText(self._tr('stop_record_button'))
             self.tab_widget.setTabEnabled(1, False)
             self.tab_widget.setTabEnabled(3, False)
@@ -1403,58 +1777,57 @@ class MainWindow(QtWidgets.QMainWindow):
     def _on_playback_finished(self):
         self.sig_log_message.emit("Playback finished.")
         self.playback_worker = None
-        self.status_label.setText(self._tr('status_stopped'))
+        self._set_status('status_stopped')
         self.playback_button.setText(self._tr('playback_button'))
         self.tab_widget.setTabEnabled(1, True)
         self.tab_widget.setTabEnabled(3, True)
 
     # --- Global Input Handlers ---
     def _on_key_press(self, key):
-        emergency_key_str = (self.emergency_key_edit.text() or "esc").lower()
-        key_matched = False
+        # Character keys carry .char, special keys (esc, space, ...) only .name; no exceptions on the hot path.
+        char = getattr(key, 'char', None)
+        pressed = char.lower() if char is not None else (getattr(key, 'name', None) or "").lower()
 
-        if hasattr(key, 'char') and key.char is not None:
-            if key.char.lower() == emergency_key_str: key_matched = True
-        elif hasattr(key, 'name') and key.name is not None:
-            if key.name.lower() == emergency_key_str: key_matched = True
-
-        if key_matched:
+        if pressed == self._emergency_key:
             self.sig_log_message.emit("Emergency STOP triggered!")
-            if self.is_recording: self._toggle_recording()
-            if self.is_armed: self.is_armed = False
+            # Stopping the workers only sets their events, so it happens right here; the UI reset is queued.
             if self.worker: self.worker.stop()
             if self.afk_worker: self.afk_worker.stop()
             if self.playback_worker: self.playback_worker.stop()
+            self.sig_emergency_stop.emit()
             return
 
-        if isinstance(QtWidgets.QApplication.focusWidget(), (QtWidgets.QLineEdit, QPlainTextEdit)):
-            return
+        if char is None: return
+        self.sig_key_char.emit(pressed) # Hotkeys are classified on the GUI thread.
 
-        try:
-            pressed_char = key.char.lower()
-        except AttributeError:
-            return
+    @QtCore.pyqtSlot()
+    def _on_emergency_stop(self):
+        if self.is_recording: self._toggle_recording()
+        if self.is_armed: self.is_armed = False
 
-        afk_hotkey = (self.afk_hotkey_edit.text() or "p").lower()
-        if pressed_char == afk_hotkey:
-            if self.afk_enabled_check.isChecked() and not (self.worker and self.worker.isRunning()):
-                self.sig_toggle_afk.emit()
+    @QtCore.pyqtSlot(str)
+    def _handle_key_char(self, pressed_char):
+        if self._focus_in_text_input:
             return
+        handler = self._hotkey_map.get(pressed_char)
+        if handler: handler()
 
-        activation_key = (self.activation_key_edit.text() or "r").lower()
-        if pressed_char == activation_key:
-            if self.autoclicker_enabled_check.isChecked() and not (self.afk_worker and self.afk_worker.isRunning()):
-                self.sig_trigger_action.emit()
-            return
+    def _on_afk_hotkey(self):
+        if self.afk_enabled_check.isChecked() and not (self.worker and self.worker.isRunning()):
+            self.on_toggle_afk_worker()
+
+    def _on_activation_hotkey(self):
+        if self.autoclicker_enabled_check.isChecked() and not (self.afk_worker and self.afk_worker.isRunning()):
+            self.on_trigger_action()
 
     def on_toggle_armed(self):
         self.is_armed = not self.is_armed
         if self.is_armed:
             self.sig_log_message.emit("Hold mode armed.")
-            self.status_label.setText(self._tr('status_armed'))
+            self._set_status('status_armed')
         else:
             self.sig_log_message.emit("Hold mode disarmed.")
-            self.status_label.setText(self._tr('status_stopped'))
+            self._set_status('status_stopped')
             if self.worker and self.worker.isRunning(): self.sig_stop_clicking.emit()
 
     def on_trigger_action(self):
@@ -1462,10 +1835,23 @@ class MainWindow(QtWidgets.QMainWindow):
         else:
             if self.worker and self.worker.isRunning(): self.sig_stop_clicking.emit()
             else:
-                button = MouseButton.right if self.toggle_rmb_radio.isChecked() else MouseButton.left
+                button = MouseButton.right if self.toggle_button_group.checkedId() == 1 else MouseButton.left
                 self.sig_start_clicking.emit(button)
 
+    # Called by ClickWorker right before it clicks: one click produces a press and a release event.
+    def register_programmatic_click(self):
+        with self._programmatic_lock: self._programmatic_events += 2
+
+    # Returns True (and counts it off) if the current mouse event was generated by ClickWorker.
+    def _consume_programmatic_event(self):
+        with self._programmatic_lock:
+            if self._programmatic_events <= 0: return False
+            self._programmatic_events -= 1
+            return True
+
     def _on_mouse_click(self, x, y, button, pressed):
+        if self._consume_programmatic_event(): return
+
         if self.is_recording and pressed:
             current_time = time.perf_counter()
             delay = current_time - self.last_click_time
@@ -1479,10 +1865,6 @@ class MainWindow(QtWidgets.QMainWindow):
         if self.afk_worker and self.afk_worker.isRunning(): return
         if not self.hold_mode_radio.isChecked(): return
 
-        if self.programmatic_click:
-            if not pressed: self.programmatic_click = False
-            return
-
         is_worker_running = self.worker is not None and self.worker.isRunning()
         if not self.is_armed: return
         if pressed and not is_worker_running:
@@ -1492,58 +1874,59 @@ class MainWindow(QtWidgets.QMainWindow):
 
     # --- UI Logic Handlers ---
     def _on_mode_changed(self, *args):
-        is_toggle = self.toggle_mode_radio.isChecked()
-        is_burst = self.burst_mode_radio.isChecked()
+        mode = ACTIVATION_MODES[self.mode_group.checkedId()]
+        is_toggle = mode == "toggle"
+        is_burst = mode == "burst"
         self.button_choice_widget.setVisible(is_toggle or is_burst)
         self.burst_options_widget.setVisible(is_burst)
         self.fixed_pos_widget.setVisible(is_toggle)
         self.click_limit_label.setVisible(is_toggle)
         self.click_limit_spin.setVisible(is_toggle)
+        self._update_mouse_listener()
 
     def _on_autoclicker_enabled_toggled(self, checked):
-        self.autoclicker_controls_widget.setVisible(checked)
-        self.autoclicker_disabled_label.setVisible(not checked)
+        self._show_module_controls(self.autoclicker_controls_widget, self.autoclicker_disabled_label, checked)
 
     def _on_afk_enabled_toggled(self, checked):
-        self.afk_controls_widget.setVisible(checked)
-        self.afk_disabled_label.setVisible(not checked)
+        self._show_module_controls(self.afk_controls_widget, self.afk_disabled_label, checked)
 
-    def _on_afk_use_human_move_toggled(self, checked):
-        self.afk_human_move_mode_combo.setEnabled(checked)
-        self.afk_human_move_duration_spin.setEnabled(checked)
+    # Swaps a module tab between its controls and the "module disabled" notice in a single repaint.
+    def _show_module_controls(self, controls_widget, disabled_label, enabled):
+        tab = controls_widget.parentWidget()
+        tab.setUpdatesEnabled(False)
+        controls_widget.setVisible(enabled)
+        disabled_label.setVisible(not enabled)
+        tab.setUpdatesEnabled(True)
+
+    @QtCore.pyqtSlot(bool)
+    def _apply_enable_group(self, checked):
+        for w in self._enable_groups[self.sender()]: w.setEnabled(checked)
 
     def _capture_mouse_position(self):
         self.capture_pos_button.setEnabled(False)
-        self.capture_countdown = 3
-        self.capture_timer = QtCore.QTimer(self); self.capture_timer.timeout.connect(self._update_capture_countdown); self.capture_timer.start(1000)
-        self._update_capture_countdown()
-
-    def _update_capture_countdown(self):
-        if self.capture_countdown > 0:
-            self.capture_pos_button.setText(self._tr('capture_pos_button_countdown').format(count=self.capture_countdown))
-            self.capture_countdown -= 1
-        else:
-            self.capture_timer.stop()
-            self._perform_capture()
+        countdown_text = self._tr('capture_pos_button_countdown')
+        for i in range(3): QtCore.QTimer.singleShot(1000 * i, lambda count=3 - i: self.capture_pos_button.setText(countdown_text.format(count=count)))
+        QtCore.QTimer.singleShot(3000, self._perform_capture)
 
     def _perform_capture(self):
-        pos = MouseController().position
+        pos = SHARED_MOUSE.position
         self.fixed_pos_x_spin.setValue(pos[0]); self.fixed_pos_y_spin.setValue(pos[1])
         self.capture_pos_button.setText(self._tr('capture_pos_button')); self.capture_pos_button.setEnabled(True)
 
     @QtCore.pyqtSlot(bool)
     def _set_always_on_top(self, checked):
-        flags = self.windowFlags()
-        if checked: self.setWindowFlags(flags | QtCore.Qt.WindowType.WindowStaysOnTopHint)
-        else: self.setWindowFlags(flags & ~QtCore.Qt.WindowType.WindowStaysOnTopHint)
+        on_top_hint = QtCore.Qt.WindowType.WindowStaysOnTopHint
+        if bool(self.windowFlags() & on_top_hint) == checked: return # Changing flags recreates the native window.
+        self.setWindowFlag(on_top_hint, checked)
         self.show()
 
     def _open_color_picker(self):
         color = QtWidgets.QColorDialog.getColor(self.accent_color, self, "Select Accent Color")
         if color.isValid():
             self.accent_color = color
+            self._accent_hex = color.name()
             self._update_theme()
-            self._save_active_profile_from_ui()
+            self._update_profile_setting("accent_color", lambda: self._accent_hex)
 
     @QtCore.pyqtSlot(str)
     def _on_log_message(self, message):
@@ -1560,23 +1943,21 @@ class MainWindow(QtWidgets.QMainWindow):
     # Profile Management
     # =====================================================================
     def _load_profiles_to_ui(self):
-        self.profiles_combo.blockSignals(True)
-        self.profiles_combo.clear()
-
-        profiles = self.settings.get("profiles", {})
-        if not profiles:
-            default_profile = self._get_settings_from_ui()
-            self.settings["profiles"] = {"Default": default_profile}
-            self.settings["active_profile"] = "Default"
+        with signals_blocked(self.profiles_combo):
+            self.profiles_combo.clear()
 
-        profile_names = list(self.settings.get("profiles", {}).keys())
-        self.profiles_combo.addItems(profile_names)
+            profiles = self.settings.get("profiles", {})
+            if not profiles:
+                default_profile = self._get_settings_from_ui()
+                self.settings["profiles"] = {"Default": default_profile}
+                self.settings["active_profile"] = "Default"
 
-        active_profile = self.settings.get("active_profile", "Default")
-        if active_profile in profile_names:
-            self.profiles_combo.setCurrentText(active_profile)
+            profile_names = list(self.settings.get("profiles", {}).keys())
+            self.profiles_combo.addItems(profile_names)
 
-        self.profiles_combo.blockSignals(False)
+            active_profile = self.settings.get("active_profile", "Default")
+            if active_profile in profile_names:
+                self.profiles_combo.setCurrentText(active_profile)
 
     def _load_active_profile_to_ui(self):
         active_profile_name = self.settings.get("active_profile", "Default")
@@ -1584,12 +1965,12 @@ class MainWindow(QtWidgets.QMainWindow):
         profile_data = self.settings.get("profiles", {}).get(active_profile_name, {})
         if profile_data:
             self._load_settings_to_ui(profile_data)
-        self._connect_signals_for_saving()
 
     def _on_profile_selected(self, index):
         profile_name = self.profiles_combo.itemText(index)
         if not profile_name: return
 
+        self._flush_pending_save()
         self.settings["active_profile"] = profile_name
         save_settings(self.settings)
         self._load_active_profile_to_ui()
@@ -1666,156 +2047,199 @@ class MainWindow(QtWidgets.QMainWindow):
     # Theming, Styling, and Internationalization
     # =====================================================================
     def _update_theme(self):
-        QtWidgets.QApplication.setStyle("Fusion")
-        is_dark = self.current_theme == "dark"
+        self._theme_timer.start()
+
+    def _update_theme_impl(self):
+        self._theme_timer.stop() # A pending debounced rebuild would now be redundant.
+        theme_key = (self.current_theme == "dark", self.accent_color.rgb())
+        if theme_key == self._theme_key: return # Nothing the palette or stylesheet depend on has changed.
+        self._theme_key = theme_key
+        self._status_cache = {} # Colored status texts embed the accent.
+        palette, swatch_css, css = self._build_theme(*theme_key)
+        self.setPalette(palette)
+        self.color_swatch.setStyleSheet(swatch_css)
+        self.copyright_label.setText(COPYRIGHT_TEXT.format(ACCENT_COLOR=self._accent_hex))
+        self._update_info_texts()
+        self.setStyleSheet(css)
+
+    # Builds the palette and stylesheets for a theme; cached so switching back and forth is free.
+    @staticmethod
+    @functools.lru_cache(maxsize=8)
+    def _build_theme(is_dark, accent_rgb):
+        accent_color = QtGui.QColor.fromRgb(accent_rgb); accent_color_str = "#%06x" % (accent_rgb & 0xFFFFFF)
         if is_dark:
             base_color = QtGui.QColor(45, 45, 45); alt_color = QtGui.QColor(35, 35, 35); text_color = QtGui.QColor(220, 220, 220)
-            border_color = QtGui.QColor("#3c3c3c"); button_color = QtGui.QColor("#555"); button_hover_color = QtGui.QColor("#666")
-            button_pressed_color = QtGui.QColor("#444"); tab_bg_color = QtGui.QColor("#2d2d2d"); tab_selected_bg_color = QtGui.QColor("#454545")
+            border_hex = "#3c3c3c"; button_hex = "#555555"; button_hover_hex = "#666666"
+            button_pressed_hex = "#444444"; tab_bg_hex = "#2d2d2d"; tab_selected_bg_hex = "#454545"
         else:
             base_color = QtGui.QColor(240, 240, 240); alt_color = QtGui.QColor(255, 255, 255); text_color = QtGui.QColor(0, 0, 0)
-            border_color = QtGui.QColor("#c0c0c0"); button_color = QtGui.QColor("#e1e1e1"); button_hover_color = QtGui.QColor("#f0f0f0")
-            button_pressed_color = QtGui.QColor("#c8c8c8"); tab_bg_color = QtGui.QColor("#d4d4d4"); tab_selected_bg_color = QtGui.QColor("#f0f0f0")
+            border_hex = "#c0c0c0"; button_hex = "#e1e1e1"; button_hover_hex = "#f0f0f0"
+            button_pressed_hex = "#c8c8c8"; tab_bg_hex = "#d4d4d4"; tab_selected_bg_hex = "#f0f0f0"
 
+        # One shared brush per distinct color; the palette copy detaches once, on the first setBrush.
+        role = QtGui.QPalette.ColorRole
+        base, alt, text, accent = (QtGui.QBrush(color) for color in (base_color, alt_color, text_color, accent_color))
         palette = QtGui.QPalette()
-        palette.setColor(QtGui.QPalette.ColorRole.Window, base_color); palette.setColor(QtGui.QPalette.ColorRole.WindowText, text_color)
-        palette.setColor(QtGui.QPalette.ColorRole.Base, alt_color); palette.setColor(QtGui.QPalette.ColorRole.AlternateBase, base_color)
-        palette.setColor(QtGui.QPalette.ColorRole.ToolTipBase, text_color); palette.setColor(QtGui.QPalette.ColorRole.ToolTipText, text_color)
-        palette.setColor(QtGui.QPalette.ColorRole.Text, text_color); palette.setColor(QtGui.QPalette.ColorRole.Button, base_color)
-        palette.setColor(QtGui.QPalette.ColorRole.ButtonText, text_color); palette.setColor(QtGui.QPalette.ColorRole.BrightText, QtGui.QColor(255, 0, 0))
-        palette.setColor(QtGui.QPalette.ColorRole.Link, self.accent_color); palette.setColor(QtGui.QPalette.ColorRole.Highlight, self.accent_color)
-        palette.setColor(QtGui.QPalette.ColorRole.HighlightedText, QtGui.QColor(0, 0, 0))
-        self.setPalette(palette)
-
-        accent_color_str = self.accent_color.name()
-        self.color_swatch.setStyleSheet(f"background-color: {accent_color_str}; border: 1px solid {border_color.name()}; border-radius: 4px;")
-        self.copyright_label.setText(COPYRIGHT_TEXT.format(ACCENT_COLOR=accent_color_str))
-        self._update_info_texts()
-
-        self.setStyleSheet(f"""
+        for color_role, brush in (
+            (role.Window, base), (role.WindowText, text),
+            (role.Base, alt), (role.AlternateBase, base),
+            (role.ToolTipBase, text), (role.ToolTipText, text),
+            (role.Text, text), (role.Button, base),
+            (role.ButtonText, text), (role.BrightText, QtGui.QBrush(QtGui.QColor(255, 0, 0))),
+            (role.Link, accent), (role.Highlight, accent),
+            (role.HighlightedText, QtGui.QBrush(QtGui.QColor(0, 0, 0))),
+        ): palette.setBrush(color_role, brush)
+
+        swatch_css = f"background-color: {accent_color_str}; border: 1px solid {border_hex}; border-radius: 4px;"
+        css = f"""
             QWidget {{ font-size: 10pt; }} #mainWidget {{ padding: 5px; }}
-            QGroupBox {{ font-weight: bold; border: 1px solid {border_color.name()}; border-radius: 8px; margin-top: 1ex; }}
+            QGroupBox {{ font-weight: bold; border: 1px solid {border_hex}; border-radius: 8px; margin-top: 1ex; }}
             QGroupBox::title {{ subcontrol-origin: margin; subcontrol-position: top center; padding: 0 5px; }}
             QGroupBox:checkable::indicator {{ width: 13px; height: 13px; }}
-            QPushButton {{ background-color: {button_color.name()}; border: 1px solid {border_color.name()}; padding: 8px; border-radius: 6px; }}
-            QPushButton:hover {{ background-color: {button_hover_color.name()}; }} QPushButton:pressed {{ background-color: {button_pressed_color.name()}; }}
-            QTabWidget::pane {{ border-top: 2px solid {border_color.name()}; }}
-            QTabBar::tab {{ background: {tab_bg_color.name()}; border: 1px solid {border_color.name()}; border-bottom: none; padding: 8px 20px; border-top-left-radius: 6px; border-top-right-radius: 6px; }}
-            QTabBar::tab:selected, QTabBar::tab:hover {{ background: {tab_selected_bg_color.name()}; color: {accent_color_str}; }}
-            QSlider::groove:horizontal {{ border: 1px solid {border_color.name()}; background: {border_color.name()}; height: 4px; border-radius: 2px; }}
+            QPushButton {{ background-color: {button_hex}; border: 1px solid {border_hex}; padding: 8px; border-radius: 6px; }}
+            QPushButton:hover {{ background-color: {button_hover_hex}; }} QPushButton:pressed {{ background-color: {button_pressed_hex}; }}
+            QTabWidget::pane {{ border-top: 2px solid {border_hex}; }}
+            QTabBar::tab {{ background: {tab_bg_hex}; border: 1px solid {border_hex}; border-bottom: none; padding: 8px 20px; border-top-left-radius: 6px; border-top-right-radius: 6px; }}
+            QTabBar::tab:selected, QTabBar::tab:hover {{ background: {tab_selected_bg_hex}; color: {accent_color_str}; }}
+            QSlider::groove:horizontal {{ border: 1px solid {border_hex}; background: {border_hex}; height: 4px; border-radius: 2px; }}
             QSlider::handle:horizontal {{ background: {accent_color_str}; border: 1px solid {accent_color_str}; width: 16px; height: 16px; margin: -6px 0; border-radius: 8px; }}
             QCheckBox::indicator, QRadioButton::indicator {{ border: 1px solid #777; width: 14px; height: 14px; border-radius: 8px; }}
             QCheckBox::indicator:checked, QRadioButton::indicator:checked {{ background-color: {accent_color_str}; border-color: {accent_color_str}; }}
             #disabledLabel {{ color: #888; }}
-            QPlainTextEdit {{ border: 1px solid {border_color.name()}; border-radius: 6px; }}
-        """)
+            QPlainTextEdit {{ border: 1px solid {border_hex}; border-radius: 6px; }}
+        """
+        return palette, swatch_css, css
 
     # --- Settings Change Handlers ---
     def _change_language(self, index):
-        self.current_language = 'en' if index == 0 else 'pl'
+        self._set_language('en' if index == 0 else 'pl')
         self._retranslate_ui()
-        self._save_active_profile_from_ui()
+        self._update_profile_setting("language", lambda: self.current_language)
 
     def _change_theme(self, index):
         self.current_theme = 'dark' if index == 0 else 'light'
         self._update_theme()
-        self._save_active_profile_from_ui()
+        self._update_profile_setting("theme", lambda: self.current_theme)
 
     def _reset_settings(self):
         reply = QtWidgets.QMessageBox.question(self, self._tr('reset_confirm_title'), self._tr('reset_confirm_text'), QtWidgets.QMessageBox.StandardButton.Yes | QtWidgets.QMessageBox.StandardButton.No, QtWidgets.QMessageBox.StandardButton.No)
         if reply == QtWidgets.QMessageBox.StandardButton.Yes:
             self.sig_log_message.emit("All settings have been reset.")
+            self._save_timer.stop()
+            QtCore.QThreadPool.globalInstance().waitForDone() # Don't let a queued save recreate the file.
             if os.path.exists(SETTINGS_PATH): os.remove(SETTINGS_PATH)
             QtWidgets.QMessageBox.information(self, "Restart Required", "Settings have been reset. Please restart the application.")
             self.close()
 
+    # Collapsed info boxes are only marked stale; their text is built and laid out when expanded.
     def _update_info_texts(self):
+        self._stale_info_boxes = set(self._info_labels)
+        for box in self._info_labels:
+            if box.isChecked(): self._fill_info_text(box)
+
+    @QtCore.pyqtSlot(bool)
+    def _on_info_box_toggled(self, checked):
+        if checked: self._fill_info_text(self.sender())
+
+    def _fill_info_text(self, box):
+        if box not in self._stale_info_boxes: return
+        self._stale_info_boxes.discard(box)
         hotkeys = {
-            'activation_key': (self.activation_key_edit.text() or 'r').upper(),
-            'afk_hotkey': (self.afk_hotkey_edit.text() or 'p').upper(),
-            'emergency_key': (self.emergency_key_edit.text() or 'esc').upper(),
-            'accent_color': self.accent_color.name()
+            'activation_key': self._activation_key_text,
+            'afk_hotkey': self._afk_hotkey_text,
+            'emergency_key': self._emergency_key_text,
+            'accent_color': self._accent_hex
         }
-        self.autoclicker_info_label.setText(self._tr('autoclicker_info_text').format(**hotkeys))
-        self.antiafk_info_label.setText(self._tr('antiafk_info_text').format(**hotkeys))
+        label, key = self._info_labels[box]
+        label.setText(self._tr(key).format(**hotkeys))
 
     # --- UI Retranslation ---
     def _retranslate_ui(self):
-        self.setWindowTitle(self._tr('window_title'))
-        self.tab_widget.setTabText(0, self._tr('tab_autoclicker')); self.tab_widget.setTabIcon(0, self.style().standardIcon(QStyle.StandardPixmap.SP_ComputerIcon))
-        self.tab_widget.setTabText(1, self._tr('tab_antiafk')); self.tab_widget.setTabIcon(1, self.style().standardIcon(QStyle.StandardPixmap.SP_DialogYesButton))
-        self.tab_widget.setTabText(2, self._tr('tab_logs')); self.tab_widget.setTabIcon(2, self.style().standardIcon(QStyle.StandardPixmap.SP_FileDialogInfoView))
-        self.tab_widget.setTabText(3, self._tr('tab_settings')); self.tab_widget.setTabIcon(3, self.style().standardIcon(QStyle.StandardPixmap.SP_FileDialogDetailedView))
-
-        self.close_button.setText(self._tr('close_button'))
-        self.clear_logs_button.setText(self._tr('clear_logs_button'))
+        # Dozens of texts change at once; repaint the window once afterwards. During a profile load
+        # updates are already suspended and stay that way until the load finishes.
+        if not self.updatesEnabled(): return self._retranslate_widgets()
+        self.setUpdatesEnabled(False)
+        try: self._retranslate_widgets()
+        finally: self.setUpdatesEnabled(True)
+
+    def _retranslate_widgets(self):
+        t = collections.ChainMap(self._lang_map, TRANSLATIONS['en']) # Resolved once for the whole pass.
+        self.setWindowTitle(t['window_title'])
+        self.tab_widget.setTabText(0, t['tab_autoclicker']); self.tab_widget.setTabIcon(0, self._tab_icons[0])
+        self.tab_widget.setTabText(1, t['tab_antiafk']); self.tab_widget.setTabIcon(1, self._tab_icons[1])
+        self.tab_widget.setTabText(2, t['tab_logs']); self.tab_widget.setTabIcon(2, self._tab_icons[2])
+        self.tab_widget.setTabText(3, t['tab_settings']); self.tab_widget.setTabIcon(3, self._tab_icons[3])
+
+        self.close_button.setText(t['close_button'])
+        self.clear_logs_button.setText(t['clear_logs_button'])
 
         # Autoclicker Tab
-        self.lmb_box.setTitle(self._tr('lmb_box_title'))
-        self.rmb_box.setTitle(self._tr('rmb_box_title'))
-        self.global_settings_box.setTitle(self._tr('global_settings_title'))
-        self.activation_mode_label.setText(self._tr('activation_mode_label'))
-        self.hold_mode_radio.setText(self._tr('hold_mode_radio')); self.toggle_mode_radio.setText(self._tr('toggle_mode_radio')); self.burst_mode_radio.setText(self._tr('burst_mode_radio'))
-        self.click_with_label.setText(self._tr('click_with_label')); self.toggle_lmb_radio.setText(self._tr('left_button_radio')); self.toggle_rmb_radio.setText(self._tr('right_button_radio'))
-        self.burst_clicks_label.setText(self._tr('burst_clicks_label')); self.burst_delay_label.setText(self._tr('burst_delay_label'))
-        self.fixed_pos_check.setText(self._tr('fixed_pos_check')); self.capture_pos_button.setText(self._tr('capture_pos_button'))
-        self.click_limit_label.setText(self._tr('click_limit_label'))
-        self.hotkey_box.setTitle(self._tr('hotkeys_title'))
-        self.activation_key_label.setText(self._tr('activation_key_label'))
-        self.activation_key_edit.setPlaceholderText(self._tr('activation_key_placeholder'))
-        self.record_playback_box.setTitle(self._tr('record_playback_title'))
-        self.record_button.setText(self._tr('stop_record_button') if self.is_recording else self._tr('record_button'))
-        self.playback_button.setText(self._tr('stop_record_button') if self.playback_worker and self.playback_worker.isRunning() else self._tr('playback_button'))
-        self.playback_reps_label.setText(self._tr('playback_reps_label'))
-        self.recorded_clicks_count_label.setText(self._tr('recorded_clicks_label').format(count=len(self.recorded_sequence)))
-        self.autoclicker_summary_box.setTitle(self._tr('autoclicker_summary_title'))
-        self.autoclicker_info_box.setTitle(self._tr('autoclicker_info_title'))
+        self.lmb_box.setTitle(t['lmb_box_title'])
+        self.rmb_box.setTitle(t['rmb_box_title'])
+        self.global_settings_box.setTitle(t['global_settings_title'])
+        self.activation_mode_label.setText(t['activation_mode_label'])
+        self.hold_mode_radio.setText(t['hold_mode_radio']); self.toggle_mode_radio.setText(t['toggle_mode_radio']); self.burst_mode_radio.setText(t['burst_mode_radio'])
+        self.click_with_label.setText(t['click_with_label']); self.toggle_lmb_radio.setText(t['left_button_radio']); self.toggle_rmb_radio.setText(t['right_button_radio'])
+        self.burst_clicks_label.setText(t['burst_clicks_label']); self.burst_delay_label.setText(t['burst_delay_label'])
+        self.fixed_pos_check.setText(t['fixed_pos_check']); self.capture_pos_button.setText(t['capture_pos_button'])
+        self.click_limit_label.setText(t['click_limit_label'])
+        self.hotkey_box.setTitle(t['hotkeys_title'])
+        self.activation_key_label.setText(t['activation_key_label'])
+        self.activation_key_edit.setPlaceholderText(t['activation_key_placeholder'])
+        self.record_playback_box.setTitle(t['record_playback_title'])
+        self.record_button.setText(t['stop_record_button'] if self.is_recording else t['record_button'])
+        self.playback_button.setText(t['stop_record_button'] if self.playback_worker and self.playback_worker.isRunning() else t['playback_button'])
+        self.playback_reps_label.setText(t['playback_reps_label'])
+        self.recorded_clicks_count_label.setText(t['recorded_clicks_label'].format(count=len(self.recorded_sequence)))
+        self.autoclicker_summary_box.setTitle(t['autoclicker_summary_title'])
+        self.autoclicker_info_box.setTitle(t['autoclicker_info_title'])
 
         # Anti-AFK Tab
-        self.antiafk_actions_box.setTitle(self._tr('antiafk_actions_title'))
-        self.mouse_movement_box.setTitle(self._tr('mouse_movement_title'))
-        self.key_press_box.setTitle(self._tr('key_press_title'))
-        self.hotkey_box_afk.setTitle(self._tr('hotkeys_title'))
-        self.perform_actions_every_label.setText(self._tr('perform_actions_every_label')); self.interval_min_label.setText(self._tr('interval_min_label')); self.interval_max_label.setText(self._tr('interval_max_label'))
-        self.afk_move_mouse_check.setText(self._tr('move_mouse_check')); self.movement_range_label.setText(self._tr('movement_range_label'))
-        self.afk_use_human_moves_check.setText(self._tr('use_human_moves_check'))
-        self.human_move_mode_label.setText(self._tr('human_move_mode_label'))
-        self.afk_human_move_mode_combo.setItemText(0, self._tr('human_move_mode_bezier1')); self.afk_human_move_mode_combo.setItemText(1, self._tr('human_move_mode_bezier2')); self.afk_human_move_mode_combo.setItemText(2, self._tr('human_move_mode_gravity'))
-        self.human_move_duration_label.setText(self._tr('human_move_duration_label'))
-        self.afk_return_to_start_check.setText(self._tr('return_to_start_check'))
-        self.afk_click_mouse_check.setText(self._tr('click_mouse_check'))
-        self.afk_scroll_mouse_check.setText(self._tr('scroll_mouse_check'))
-        self.afk_press_keys_check.setText(self._tr('press_keys_check')); self.presets_label.setText(self._tr('presets_label'))
-        self.custom_keys_label.setText(self._tr('custom_keys_label')); self.afk_custom_keys_edit.setPlaceholderText(self._tr('custom_keys_placeholder'))
-        self.afk_hotkey_label.setText(self._tr('antiafk_hotkey_label'))
-        self.afk_hotkey_edit.setPlaceholderText(self._tr('afk_hotkey_placeholder'))
-        self.antiafk_summary_box.setTitle(self._tr('antiafk_summary_title'))
-        self.antiafk_info_box.setTitle(self._tr('antiafk_info_title'))
+        self.antiafk_actions_box.setTitle(t['antiafk_actions_title'])
+        self.mouse_movement_box.setTitle(t['mouse_movement_title'])
+        self.key_press_box.setTitle(t['key_press_title'])
+        self.hotkey_box_afk.setTitle(t['hotkeys_title'])
+        self.perform_actions_every_label.setText(t['perform_actions_every_label']); self.interval_min_label.setText(t['interval_min_label']); self.interval_max_label.setText(t['interval_max_label'])
+        self.afk_move_mouse_check.setText(t['move_mouse_check']); self.movement_range_label.setText(t['movement_range_label'])
+        self.afk_use_human_moves_check.setText(t['use_human_moves_check'])
+        self.human_move_mode_label.setText(t['human_move_mode_label'])
+        self.afk_human_move_mode_combo.setItemText(0, t['human_move_mode_bezier1']); self.afk_human_move_mode_combo.setItemText(1, t['human_move_mode_bezier2']); self.afk_human_move_mode_combo.setItemText(2, t['human_move_mode_gravity'])
+        self.human_move_duration_label.setText(t['human_move_duration_label'])
+        self.afk_return_to_start_check.setText(t['return_to_start_check'])
+        self.afk_click_mouse_check.setText(t['click_mouse_check'])
+        self.afk_scroll_mouse_check.setText(t['scroll_mouse_check'])
+        self.afk_press_keys_check.setText(t['press_keys_check']); self.presets_label.setText(t['presets_label'])
+        self.afk_skip_when_active_check.setText(t['skip_when_active_check'])
+        self.custom_keys_label.setText(t['custom_keys_label']); self.afk_custom_keys_edit.setPlaceholderText(t['custom_keys_placeholder'])
+        self.afk_hotkey_label.setText(t['antiafk_hotkey_label'])
+        self.afk_hotkey_edit.setPlaceholderText(t['afk_hotkey_placeholder'])
+        self.antiafk_summary_box.setTitle(t['antiafk_summary_title'])
+        self.antiafk_info_box.setTitle(t['antiafk_info_title'])
 
         # Settings Tab
-        self.module_activation_box.setTitle(self._tr('module_activation_title'))
-        self.autoclicker_enabled_check.setText(self._tr('enable_autoclicker_check'))
-        self.afk_enabled_check.setText(self._tr('enable_antiafk_check'))
-        self.settings_box.setTitle(self._tr('app_settings_title'))
-        self.profiles_box.setTitle(self._tr('profiles_title'))
-        self.profile_name_label.setText(self._tr('profile_name_label'))
-        self.save_profile_button.setText(self._tr('save_profile_button'))
-        self.delete_profile_button.setText(self._tr('delete_profile_button'))
-        self.import_profile_button.setText(self._tr('import_profile_button'))
-        self.export_profile_button.setText(self._tr('export_profile_button'))
-        self.language_label.setText(self._tr('language_label'))
-        self.theme_label.setText(self._tr('theme_label')); self.theme_combo.setItemText(0, self._tr('theme_dark')); self.theme_combo.setItemText(1, self._tr('theme_light'))
-        self.start_delay_label.setText(self._tr('start_delay_label'))
-        self.emergency_key_label.setText(self._tr('emergency_key_label'))
-        self.emergency_key_edit.setPlaceholderText(self._tr('emergency_key_placeholder'))
-        self.limit_window_check.setText(self._tr('limit_window_check')); self.window_title_edit.setPlaceholderText(self._tr('window_title_placeholder'))
-        self.always_on_top_checkbox.setText(self._tr('always_on_top_check'))
-        self.accent_color_label.setText(self._tr('accent_color_label')); self.change_color_button.setText(self._tr('change_color_button'))
-        self.reset_settings_label.setText(self._tr('reset_settings_label'))
-        self.reset_settings_button.setText(self._tr('reset_settings_button'))
-
-        self.autoclicker_disabled_label.setText(self._tr('module_disabled_info'))
-        self.afk_disabled_label.setText(self._tr('module_disabled_info'))
+        self.module_activation_box.setTitle(t['module_activation_title'])
+        self.autoclicker_enabled_check.setText(t['enable_autoclicker_check'])
+        self.afk_enabled_check.setText(t['enable_antiafk_check'])
+        self.settings_box.setTitle(t['app_settings_title'])
+        self.profiles_box.setTitle(t['profiles_title'])
+        self.profile_name_label.setText(t['profile_name_label'])
+        self.save_profile_button.setText(t['save_profile_button'])
+        self.delete_profile_button.setText(t['delete_profile_button'])
+        self.import_profile_button.setText(t['import_profile_button'])
+        self.export_profile_button.setText(t['export_profile_button'])
+        self.language_label.setText(t['language_label'])
+        self.theme_label.setText(t['theme_label']); self.theme_combo.setItemText(0, t['theme_dark']); self.theme_combo.setItemText(1, t['theme_light'])
+        self.start_delay_label.setText(t['start_delay_label'])
+        self.emergency_key_label.setText(t['emergency_key_label'])
+        self.emergency_key_edit.setPlaceholderText(t['emergency_key_placeholder'])
+        self.limit_window_check.setText(t['limit_window_check']); self.window_title_edit.setPlaceholderText(t['window_title_placeholder'])
+        self.always_on_top_checkbox.setText(t['always_on_top_check'])
+        self.accent_color_label.setText(t['accent_color_label']); self.change_color_button.setText(t['change_color_button'])
+        self.reset_settings_label.setText(t['reset_settings_label'])
+        self.reset_settings_button.setText(t['reset_settings_button'])
+
+        self.autoclicker_disabled_label.setText(t['module_disabled_info'])
+        self.afk_disabled_label.setText(t['module_disabled_info'])
 
         self._update_info_texts()
 
@@ -1825,17 +2249,15 @@ class MainWindow(QtWidgets.QMainWindow):
 
     def _update_autoclicker_summary(self):
         summary_parts = []
-        mode = "Hold"
-        if self.toggle_mode_radio.isChecked(): mode = "Toggle"
-        if self.burst_mode_radio.isChecked(): mode = "Burst"
+        mode = ACTIVATION_MODES[self.mode_group.checkedId()].capitalize()
         summary_parts.append(f"• Mode: <b>{mode}</b>")
 
         if mode in ["Toggle", "Burst"]:
-            button = "Left" if self.toggle_lmb_radio.isChecked() else "Right"
+            button = "Right" if self.toggle_button_group.checkedId() == 1 else "Left"
             summary_parts.append(f"• Clicking with: <b>{button} Button</b>")
 
-        lmb_cps = self.lmb_box.widgets['slider'].value() / 10.0
-        rmb_cps = self.rmb_box.widgets['slider'].value() / 10.0
+        lmb_cps = self.lmb_slider.value() / 10.0
+        rmb_cps = self.rmb_slider.value() / 10.0
         summary_parts.append(f"• CPS: <b>LMB: {lmb_cps:.1f} / RMB: {rmb_cps:.1f}</b>")
 
         if mode == "Toggle":
@@ -1874,7 +2296,7 @@ class MainWindow(QtWidgets.QMainWindow):
             if self.afk_key_s.isChecked(): keys.append('S')
             if self.afk_key_d.isChecked(): keys.append('D')
             if self.afk_key_space.isChecked(): keys.append('Space')
-            custom = self.afk_custom_keys_edit.text()
+            custom = self._afk_custom_keys_text
             if custom:
                 keys.append(f"Custom({custom})")
 
@@ -1887,6 +2309,8 @@ class MainWindow(QtWidgets.QMainWindow):
         if len(summary_parts) == 1:
             summary_text = "<b>No actions enabled.</b> Only the interval is set."
         else:
+            if self.afk_skip_when_active_check.isChecked() and _GetLastInputInfo is not None:
+                summary_parts.append("• Skip When Active: <b>Yes</b>")
             summary_text = "<br>".join(summary_parts)
 
         self.antiafk_summary_label.setText(summary_text)
@@ -1896,10 +2320,14 @@ class MainWindow(QtWidgets.QMainWindow):
     # =====================================================================
 
     def closeEvent(self, event):
-        if self.worker: self.worker.stop()
-        if self.afk_worker: self.afk_worker.stop()
-        if self.playback_worker: self.playback_worker.stop()
-        self.mouse_listener.stop(); self.keyboard_listener.stop()
+        self._flush_pending_save()
+        QtCore.QThreadPool.globalInstance().waitForDone() # Finish writing settings before exiting.
+        # Signal everything to stop first, then wait, so shutdown takes as long as the slowest worker rather than the sum.
+        workers = [worker for worker in (self.worker, self.afk_worker, self.playback_worker) if worker]
+        for worker in workers: worker.stop()
+        self.keyboard_listener.stop() # Listener stops are non-blocking and remove the global input hooks.
+        if self.mouse_listener: self.mouse_listener.stop()
+        for worker in workers: worker.wait()
         event.accept()
         QtWidgets.QApplication.quit() # Ensure the application exits cleanly
 
@@ -1915,6 +2343,7 @@ class MainWindow(QtWidgets.QMainWindow):
 def main():
     app = QtWidgets.QApplication(sys.argv)
     app.setQuitOnLastWindowClosed(True)
+    app.setStyle("Fusion")
     mw = MainWindow()
     mw.show()
     sys.exit(app.exec())